@@ -31,6 +31,7 @@ from agent.core.events import (
     ImageInputEvent,
     TextInputEvent,
 )
+from agent.core.serialization import dumps, loads
 from agent.core.settings import Settings
 from agent.messaging.websocket import WebSocketChannel
 
@@ -60,7 +61,7 @@ class UvicornApiService(ApiService):
             log_level="info",
         )
         server = uvicorn.Server(config)
-        logger.info(f"Starting API server on {self.host}:{self.port}")
+        logger.info("Starting API server on %s:%s", self.host, self.port)
         await server.serve()
 
 
@@ -97,12 +98,12 @@ def create_api(event_queue: asyncio.Queue[AgentEvent], project_dir: str) -> Fast
         """WebSocket endpoint: one session per connection."""
         await websocket.accept()
         chat_id = f"ws-{uuid.uuid4().hex}"
-        logger.info(f"WebSocket connected: chat_id={chat_id}")
+        logger.info("WebSocket connected: chat_id=%s", chat_id)
 
         try:
-            await websocket.send_json({"type": "connected", "chat_id": chat_id})
+            await websocket.send_text(dumps({"type": "connected", "chat_id": chat_id}))
             while True:
-                data = await websocket.receive_json()
+                data = loads(await websocket.receive_text())
                 msg_type: str = data.get("type", "text")
                 message_id: str = data.get("message_id") or uuid.uuid4().hex
                 message: str = data.get("message", "")
@@ -115,8 +116,11 @@ def create_api(event_queue: asyncio.Queue[AgentEvent], project_dir: str) -> Fast
                         continue
                     image_bytes = base64.b64decode(raw_data)
                     logger.debug(
-                        f"[{chat_id}] received image (id={message_id}, "
-                        f"mime={mime_type}, size={len(image_bytes)}B)"
+                        "[%s] received image (id=%s, mime=%s, size=%dB)",
+                        chat_id,
+                        message_id,
+                        mime_type,
+                        len(image_bytes),
                     )
                     await event_queue.put(
                         ImageInputEvent(
@@ -130,7 +134,10 @@ def create_api(event_queue: asyncio.Queue[AgentEvent], project_dir: str) -> Fast
                     )
                 else:
                     logger.debug(
-                        f"[{chat_id}] received message (id={message_id}): {message[:100]}"
+                        "[%s] received message (id=%s): %.100s",
+                        chat_id,
+                        message_id,
+                        message,
                     )
                     await event_queue.put(
                         TextInputEvent(
@@ -141,12 +148,12 @@ def create_api(event_queue: asyncio.Queue[AgentEvent], project_dir: str) -> Fast
                         )
                     )
         except WebSocketDisconnect:
-            logger.info(f"WebSocket disconnected: chat_id={chat_id}")
+            logger.info("WebSocket disconnected: chat_id=%s", chat_id)
         except Exception as e:
-            logger.error(f"WebSocket error [{chat_id}]: {e}", exc_info=True)
+            logger.error("WebSocket error [%s]: %s", chat_id, e, exc_info=True)
         finally:
             await event_queue.put(DropSessionEvent(chat_id=chat_id))
-            logger.debug(f"DropSessionEvent queued for chat_id={chat_id}")
+            logger.debug("DropSessionEvent queued for chat_id=%s", chat_id)
 
     @app.get("/api/health")
     async def health_check() -> dict:
@@ -1,15 +1,57 @@
 import asyncio
 import base64
+import contextlib
 import difflib
 import logging
+import os
+import re
 import shlex
 import shutil
+import signal
+import uuid
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, override
 
+from agent.core.serialization import dumps
+
 logger = logging.getLogger(__name__)
 
+_POSIX = os.name == "posix"
+_MAX_IDLE_SHELLS = 4
+# Applies edit_file's search/replace blocks inside the container. Exits
+# non-zero on any mismatch so the caller can fall back to the generic path,
+# which produces the detailed error message.
+_EDIT_SCRIPT = """
+import json, sys
+path = sys.argv[1]
+with open(path, encoding="utf-8", errors="replace", newline="") as f:
+    content = f.read()
+for edit in json.loads(sys.stdin.buffer.read()):
+    search = edit["search"]
+    start = content.find(search)
+    end = start + len(search)
+    if start == -1 or content.find(search, end) != -1:
+        sys.exit(3)
+    content = content[:start] + edit["replace"] + content[end:]
+with open(path, "w", encoding="utf-8", newline="") as f:
+    f.write(content)
+"""
+# Writes write_files' batch inside the container. Exits non-zero on any
+# error so the caller can fall back to one write_file per file.
+_WRITE_SCRIPT = """
+import json, os, sys
+for item in json.loads(sys.stdin.buffer.read()):
+    path = item["filename"]
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(item["content"])
+"""
+_SHELL_READ_CHUNK = 64 * 1024
+# Upper bound on the text a single read_file call returns.
+_MAX_READ_CHARS = 8 * 1024 * 1024
 _TRUNCATION_SUFFIX = "\n\n(truncated: output is too long, try saving to a temporary file and read section by section)"
 
 
@@ -17,10 +59,16 @@ def _truncate(text: str, limit: int) -> str:
     return text[:limit] + _TRUNCATION_SUFFIX if len(text) > limit else text
 
 
+def _saved_message(files: list[dict[str, str]]) -> str:
+    return f"Content saved to {', '.join(item['filename'] for item in files)}"
+
+
 def _find_closest_block(content: str, search: str) -> str | None:
     """Return the closest matching block in *content* for *search*, or None.
 
-    Slides a window of the same line-count as *search* over *content* and
+    A window whose lines equal *search*'s modulo surrounding whitespace (the
+    usual indentation slip) is returned from a linear pre-pass. Otherwise
+    slides a window of the same line-count as *search* over *content* and
     returns the window with the highest SequenceMatcher ratio, provided it
     exceeds 0.6.  Uses quick_ratio() as a cheap pre-filter and exits early
     on a perfect match to avoid unnecessary work on large files.
@@ -30,6 +78,11 @@ def _find_closest_block(content: str, search: str) -> str | None:
     n = len(search_lines)
     if n == 0 or n > len(content_lines):
         return None
+    target = [line.strip() for line in search_lines]
+    stripped = [line.strip() for line in content_lines]
+    for i in range(len(stripped) - n + 1):
+        if stripped[i] == target[0] and stripped[i : i + n] == target:
+            return "\n".join(content_lines[i : i + n])
     best_ratio, best_start = 0.0, 0
     for i in range(len(content_lines) - n + 1):
         window = "\n".join(content_lines[i : i + n])
@@ -46,6 +99,163 @@ def _find_closest_block(content: str, search: str) -> str | None:
     return None
 
 
+def _output_cap(max_output_chars: int) -> int:
+    """Bytes of output to keep so decoding still exceeds *max_output_chars*.
+
+    UTF-8 needs at most four bytes per character, so any output cut at this
+    size decodes to more than the limit and is marked as truncated.
+    """
+    return 4 * (max_output_chars + 1)
+
+
+async def _read_capped(stream: asyncio.StreamReader, max_bytes: int) -> bytes:
+    """Read *stream* to EOF, keeping only its first *max_bytes* bytes."""
+    buffer = bytearray()
+    while chunk := await stream.read(_SHELL_READ_CHUNK):
+        if len(buffer) < max_bytes:
+            buffer += chunk[: max_bytes - len(buffer)]
+    return bytes(buffer)
+
+
+async def _communicate(
+    process: asyncio.subprocess.Process,
+    input_data: bytes | None = None,
+    process_group: bool = False,
+    max_bytes: int | None = None,
+) -> tuple[bytes, bytes]:
+    """Wait for *process* to finish, killing it if the caller is cancelled.
+
+    Callers enforce timeouts with asyncio.timeout, which cancels this
+    coroutine; without the kill the child would keep running unsupervised.
+    With *process_group* the whole group led by *process* is killed, so
+    commands spawned by a shell do not outlive it and hold its pipes open.
+    With *max_bytes* each stream is drained in chunks and only its head is
+    kept, so a chatty command cannot grow the agent's memory without bound.
+    """
+    try:
+        if max_bytes is None or input_data is not None:
+            return await process.communicate(input=input_data)
+        assert process.stdout and process.stderr
+        stdout, stderr = await asyncio.gather(
+            _read_capped(process.stdout, max_bytes),
+            _read_capped(process.stderr, max_bytes),
+        )
+        await process.wait()
+        return stdout, stderr
+    except asyncio.CancelledError:
+        if process.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                if process_group:
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+            await asyncio.shield(process.wait())
+        raise
+
+
+class _ShellSession:
+    """A long-lived shell process that runs commands written to its stdin.
+
+    Each command runs in a subshell with stdin from /dev/null, so `cd`,
+    `exit` or reads from stdin cannot disturb the session. A random marker
+    printed after the command on both streams delimits its output and carries
+    the exit status.
+    """
+
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self.process = process
+        self.marker = f"__agent_shell_{uuid.uuid4().hex}__"
+        marker = re.escape(self.marker.encode())
+        self.stdout_end = re.compile(rb"\n" + marker + rb" (\d+)\n")
+        self.stderr_end = re.compile(rb"\n" + marker + rb"\n")
+        self.stdout_buffer = bytearray()
+        self.stderr_buffer = bytearray()
+
+    @classmethod
+    async def start(cls, argv: list[str]) -> "_ShellSession":
+        """Spawn *argv* and wait until it is ready to accept commands."""
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        session = cls(process)
+        try:
+            # Flush anything the login profile prints before the first command.
+            await session.run(":")
+        except BaseException:
+            await session.close()
+            raise
+        return session
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    @staticmethod
+    async def _read_until(
+        stream: asyncio.StreamReader,
+        buffer: bytearray,
+        end: re.Pattern[bytes],
+        max_bytes: int | None,
+    ) -> re.Match[bytes]:
+        pos = 0
+        while (match := end.search(buffer, pos)) is None:
+            if max_bytes is not None and len(buffer) > max_bytes + 256:
+                # Drop output past the cap but keep a tail for the marker.
+                del buffer[max_bytes:-256]
+            pos = max(0, len(buffer) - 128)
+            chunk = await stream.read(_SHELL_READ_CHUNK)
+            if not chunk:
+                raise ConnectionError("Shell session exited")
+            buffer += chunk
+        return match
+
+    async def run(
+        self, command: str, max_bytes: int | None = None
+    ) -> tuple[bytes, bytes, int]:
+        """Run *command* and return stdout, stderr and its exit status.
+
+        With *max_bytes* only the head of each stream is returned.
+        """
+        assert self.process.stdin and self.process.stdout and self.process.stderr
+        self.process.stdin.write(
+            (
+                f"( eval {shlex.quote(command)} ) </dev/null\n"
+                f"printf '\\n%s %d\\n' {self.marker} $?\n"
+                f"printf '\\n%s\\n' {self.marker} >&2\n"
+            ).encode()
+        )
+        await self.process.stdin.drain()
+        out_match, err_match = await asyncio.gather(
+            self._read_until(
+                self.process.stdout, self.stdout_buffer, self.stdout_end, max_bytes
+            ),
+            self._read_until(
+                self.process.stderr, self.stderr_buffer, self.stderr_end, max_bytes
+            ),
+        )
+        out_end = out_match.start()
+        err_end = err_match.start()
+        if max_bytes is not None:
+            out_end = min(out_end, max_bytes)
+            err_end = min(err_end, max_bytes)
+        stdout = bytes(self.stdout_buffer[:out_end])
+        stderr = bytes(self.stderr_buffer[:err_end])
+        return_code = int(out_match.group(1))
+        del self.stdout_buffer[: out_match.end()]
+        del self.stderr_buffer[: err_match.end()]
+        return stdout, stderr, return_code
+
+    async def close(self) -> None:
+        """Kill the shell process and reap it."""
+        if self.alive:
+            with contextlib.suppress(ProcessLookupError):
+                self.process.kill()
+        await asyncio.shield(self.process.wait())
+
+
 class AgentRuntimeException(Exception):
     """Exception for agent runtime errors."""
 
@@ -80,6 +290,12 @@ class Runtime(ABC):
         """Write content to a file. Raises AgentRuntimeException on error."""
         ...
 
+    async def write_files(self, files: list[dict[str, str]]) -> dict[str, Any]:
+        """Write several files, each given as filename and content. Raises AgentRuntimeException on error."""
+        for item in files:
+            await self.write_file(item["filename"], item["content"])
+        return {"message": _saved_message(files)}
+
     async def edit_file(
         self, filename: str, edits: list[dict[str, str]]
     ) -> dict[str, Any]:
@@ -90,7 +306,8 @@ class Runtime(ABC):
         for edit in edits:
             search_block = edit["search"]
             replace_block = edit["replace"]
-            if search_block not in content:
+            start = content.find(search_block)
+            if start == -1:
                 hint = _find_closest_block(content, search_block)
                 suggestion = (
                     f"\n\nClosest match found in the file:\n\n{hint}\n\nUse that exact text as your search block."
@@ -101,12 +318,13 @@ class Runtime(ABC):
                     f"Could not find exact match in {filename} for search block\n\n{search_block}\n\n"
                     f"Ensure your SEARCH block is a literal copy of the file content. The file is left unmodified.{suggestion}"
                 )
-            if content.count(search_block) > 1:
+            end = start + len(search_block)
+            if content.find(search_block, end) != -1:
                 raise AgentRuntimeException(
                     f"Multiple occurrences of search block found in {filename}. "
                     "Please include more surrounding context to make it unique."
                 )
-            content = content.replace(search_block, replace_block, 1)
+            content = content[:start] + replace_block + content[end:]
         return await self.write_file(filename, content)
 
 
@@ -116,6 +334,14 @@ class ContainerRuntime(Runtime):
 
     This runtime delegates all operations to a running container,
     allowing the agent to work in an isolated workspace environment.
+
+    Commands run in a login bash so profile-managed tools (e.g. fnm's node)
+    are on PATH; login_shell=False skips that per-exec profile sourcing.
+
+    With persistent_shell, commands are fed to pooled long-lived
+    `exec -i ... bash` sessions instead of spawning one exec per command.
+    A session is checked out per command, so concurrent commands still run in
+    parallel; at most _MAX_IDLE_SHELLS idle sessions are kept.
     """
 
     def __init__(
@@ -124,29 +350,47 @@ class ContainerRuntime(Runtime):
         runtime: str = "podman",
         workdir: str = "/workspace",
         max_output_chars: int = 10_000,
+        persistent_shell: bool = False,
+        login_shell: bool = True,
     ):
         self.container_name: str = container_name
         self.runtime: str = runtime
         self.workdir: str = workdir
         self.max_output_chars = max_output_chars
-        self._validate_runtime()
+        self.persistent_shell = persistent_shell
+        self.shell = ["bash", "-l"] if login_shell else ["bash"]
+        self.idle_shells: list[_ShellSession] = []
+        self.runtime_path: str = self._validate_runtime()
+
+    def _validate_runtime(self) -> str:
+        """Validate that the container runtime is available.
 
-    def _validate_runtime(self) -> None:
-        """Validate that the container runtime is available."""
-        if not shutil.which(self.runtime):
+        Returns its resolved path, which is used as argv[0] so each exec
+        skips the PATH search.
+        """
+        runtime_path = shutil.which(self.runtime)
+        if not runtime_path:
             raise AgentRuntimeException(
                 f"Container runtime '{self.runtime}' not found in PATH"
             )
+        return runtime_path
 
     async def _exec_in_container(
-        self, command: str, input_data: bytes | None = None
+        self,
+        command: str,
+        input_data: bytes | None = None,
+        max_bytes: int | None = None,
     ) -> tuple[str, str, int]:
         """
         Execute a command in the container and wait for it to complete.
         If you need long running command, consider running it in background and use `run_command` to check its status.
+        With max_bytes only the head of each output stream is kept.
         Returns stdout, stderr, return_code.
         """
-        full_command = [self.runtime, "exec"]
+        if self.persistent_shell and input_data is None:
+            return await self._exec_in_shell(command, max_bytes)
+
+        full_command = [self.runtime_path, "exec"]
 
         if input_data is not None:
             full_command.append("-i")
@@ -156,14 +400,13 @@ class ContainerRuntime(Runtime):
                 "-w",
                 self.workdir,
                 self.container_name,
-                "bash",
-                "-l",
+                *self.shell,
                 "-c",
                 command,
             ]
         )
 
-        logger.debug(f"Executing in container: {command}")
+        logger.debug("Executing in container: %s", command)
 
         process = await asyncio.create_subprocess_exec(
             *full_command,
@@ -172,18 +415,60 @@ class ContainerRuntime(Runtime):
             stderr=asyncio.subprocess.PIPE,
         )
 
-        stdout, stderr = await process.communicate(input=input_data)
+        stdout, stderr = await _communicate(process, input_data, max_bytes=max_bytes)
         return (
             stdout.decode("utf-8", errors="replace"),
             stderr.decode("utf-8", errors="replace"),
             process.returncode or 0,
         )
 
+    async def _exec_in_shell(
+        self, command: str, max_bytes: int | None = None
+    ) -> tuple[str, str, int]:
+        """Run *command* on an idle pooled shell session, starting one if needed."""
+        shell = None
+        while self.idle_shells:
+            candidate = self.idle_shells.pop()
+            if candidate.alive:
+                shell = candidate
+                break
+        if shell is None:
+            shell = await _ShellSession.start(
+                [
+                    self.runtime_path,
+                    "exec",
+                    "-i",
+                    "-w",
+                    self.workdir,
+                    self.container_name,
+                    *self.shell,
+                ]
+            )
+
+        logger.debug("Executing in container shell: %s", command)
+        try:
+            stdout, stderr, return_code = await shell.run(command, max_bytes)
+        except BaseException:
+            # Cancelled or broken mid-command: the session state is unknown.
+            await shell.close()
+            raise
+        if len(self.idle_shells) < _MAX_IDLE_SHELLS:
+            self.idle_shells.append(shell)
+        else:
+            await shell.close()
+        return (
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+            return_code,
+        )
+
     @override
     async def execute(self, command: str) -> dict[str, Any]:
         """Execute a shell command in the container."""
         try:
-            stdout, stderr, return_code = await self._exec_in_container(command)
+            stdout, stderr, return_code = await self._exec_in_container(
+                command, max_bytes=_output_cap(self.max_output_chars)
+            )
         except Exception as e:
             raise AgentRuntimeException(f"Command execution failed: {e}") from e
         stdout = _truncate(stdout, self.max_output_chars)
@@ -200,7 +485,7 @@ class ContainerRuntime(Runtime):
                 raise Exception(stderr.strip())
             return base64.b64decode(stdout)
         except Exception as e:
-            logger.error(f"Failed to read file {filename}: {e}")
+            logger.error("Failed to read file %s: %s", filename, e)
             raise
 
     @override
@@ -209,46 +494,105 @@ class ContainerRuntime(Runtime):
     ) -> dict[str, Any]:
         """Read a paginated slice of a file in the container.
 
-        Uses awk + sed inside the container so only the requested lines are
-        transferred, avoiding a full base64 round-trip for large files.
-        awk 'END{print NR}' counts records the same way Python splitlines()
-        does, unlike wc -l which only counts newline characters.
+        A single awk pass inside the container prints only the requested
+        lines followed by the total line count, so large files are neither
+        transferred nor read twice. NR counts records the same way Python
+        splitlines() does, unlike wc -l which only counts newline characters.
+        The slice stops at _MAX_READ_CHARS (a lone longer line is cut), and
+        a flag after the count reports whether anything was left out.
         """
         quoted = shlex.quote(filename)
         start = max(1, start_line)
         end = start + limit - 1
-        cmd = f"awk 'END{{print NR}}' {quoted} && sed -n '{start},{end}p' {quoted}"
+        cmd = (
+            f"awk -v s={start} -v e={end} -v m={_MAX_READ_CHARS} "
+            "'NR>=s && NR<=e && !t {"
+            " if (b > 0 && b + length($0) + 1 > m) { t = 1; next }"
+            " l = substr($0, 1, m); t = length(l) < length($0);"
+            " b += length(l) + 1; print l"
+            "} END {print NR, t + 0}' "
+            f"{quoted}"
+        )
         try:
             stdout, stderr, return_code = await self._exec_in_container(cmd)
             if return_code != 0:
                 raise Exception(stderr.strip())
         except Exception as e:
             raise AgentRuntimeException(f"Failed to read file {filename}: {e}") from e
-        first_newline = stdout.index("\n")
-        total_lines = int(stdout[:first_newline].strip())
-        content = stdout[first_newline + 1 :]
-        return {
+        lines, sep, tail = stdout.rstrip("\n").rpartition("\n")
+        count, _, truncated = tail.strip().partition(" ")
+        content = lines + sep
+        result: dict[str, Any] = {
             "content": content,
-            "total_lines": total_lines,
+            "total_lines": int(count),
             "start_line": start,
             "returned_lines": len(content.splitlines()),
         }
+        if truncated == "1":
+            result["truncated"] = True
+        return result
 
     @override
     async def write_file(self, filename: str, content: str) -> dict[str, Any]:
-        """Write content to a file in the container via a single exec call."""
+        """Write content to a file in the container via a single exec call.
+
+        The raw bytes are streamed on the exec's stdin, so there is no base64
+        expansion and the content never appears on a command line.
+        """
         parent_dir = str(Path(filename).parent)
         quoted_dir = shlex.quote(parent_dir)
         quoted_file = shlex.quote(filename)
-        command = f"mkdir -p {quoted_dir} && base64 -d > {quoted_file}"
-        encoded_bytes = base64.b64encode(content.encode("utf-8"))
+        command = f"mkdir -p {quoted_dir} && cat > {quoted_file}"
         _, stderr, return_code = await self._exec_in_container(
-            command, input_data=encoded_bytes
+            command, input_data=content.encode("utf-8")
         )
         if return_code != 0:
             raise AgentRuntimeException(stderr.strip())
         return {"message": f"Content saved to {filename}"}
 
+    @override
+    async def write_files(self, files: list[dict[str, str]]) -> dict[str, Any]:
+        """Write several files in the container with a single exec.
+
+        The batch is streamed as JSON to a python3 script next to the files.
+        On any failure (bad path, no python3) the files are written one
+        write_file at a time instead, which reports the error.
+        """
+        try:
+            _, _, return_code = await self._exec_in_container(
+                f"python3 -c {shlex.quote(_WRITE_SCRIPT)}",
+                input_data=dumps(files).encode("utf-8"),
+            )
+        except Exception as e:
+            logger.debug("In-container batch write failed: %s", e)
+            return_code = -1
+        if return_code == 0:
+            return {"message": _saved_message(files)}
+        return await super().write_files(files)
+
+    @override
+    async def edit_file(
+        self, filename: str, edits: list[dict[str, str]]
+    ) -> dict[str, Any]:
+        """Apply search-and-replace edits in place inside the container.
+
+        A single exec runs the edits next to the file, so its content never
+        crosses the container boundary. On any failure (no match, ambiguous
+        match, missing file, no python3) the generic read-modify-write path
+        runs instead and reports the error.
+        """
+        command = f"python3 -c {shlex.quote(_EDIT_SCRIPT)} {shlex.quote(filename)}"
+        try:
+            _, _, return_code = await self._exec_in_container(
+                command, input_data=dumps(edits).encode("utf-8")
+            )
+        except Exception as e:
+            logger.debug("In-container edit of %s failed: %s", filename, e)
+            return_code = -1
+        if return_code == 0:
+            return {"message": f"Content saved to {filename}"}
+        return await super().edit_file(filename, edits)
+
 
 class HostRuntime(Runtime):
     """
@@ -268,8 +612,13 @@ class HostRuntime(Runtime):
                 command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                start_new_session=_POSIX,
+            )
+            stdout_bytes, stderr_bytes = await _communicate(
+                process,
+                process_group=_POSIX,
+                max_bytes=_output_cap(self.max_output_chars),
             )
-            stdout_bytes, stderr_bytes = await process.communicate()
             stdout = stdout_bytes.decode("utf-8", errors="replace")
             stderr = stderr_bytes.decode("utf-8", errors="replace")
             stdout = _truncate(stdout, self.max_output_chars)
@@ -289,27 +638,45 @@ class HostRuntime(Runtime):
         try:
             return await asyncio.to_thread(self._read_raw_bytes_sync, filename)
         except Exception as e:
-            logger.error(f"Failed to read file {filename}: {e}")
+            logger.error("Failed to read file %s: %s", filename, e)
             raise
 
     def _read_file_sync(
         self, filename: str, start_line: int, limit: int
     ) -> dict[str, Any]:
-        path = Path(filename)
-        if not path.exists():
-            raise AgentRuntimeException("File not found")
-        with path.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-        total_lines = len(lines)
         start = max(1, start_line)
         end = start + limit - 1
-        content = "".join(lines[start - 1 : end])
-        return {
+        selected: list[str] = []
+        size = 0
+        truncated = False
+        total_lines = 0
+        try:
+            with Path(filename).open("r", encoding="utf-8") as f:
+                # Stream the file so only the requested slice is kept in memory,
+                # stopping at _MAX_READ_CHARS (a lone longer line is cut).
+                for total_lines, line in enumerate(f, 1):
+                    if not start <= total_lines <= end or truncated:
+                        continue
+                    if size and size + len(line) > _MAX_READ_CHARS:
+                        truncated = True
+                        continue
+                    if len(line) > _MAX_READ_CHARS:
+                        line = line[:_MAX_READ_CHARS] + "\n"
+                        truncated = True
+                    selected.append(line)
+                    size += len(line)
+        except FileNotFoundError:
+            raise AgentRuntimeException("File not found") from None
+        content = "".join(selected)
+        result: dict[str, Any] = {
             "content": content,
             "total_lines": total_lines,
             "start_line": start,
             "returned_lines": len(content.splitlines()),
         }
+        if truncated:
+            result["truncated"] = True
+        return result
 
     @override
     async def read_file(
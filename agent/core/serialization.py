@@ -0,0 +1,32 @@
+"""
+JSON helpers for the LLM payload paths.
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+Both backends emit compact separators so output is identical either way.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any) -> str:
+    """Serialize *obj* to a compact JSON string without escaping non-ASCII."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # Non-str keys, >64-bit ints, etc.: let the stdlib handle or reject it.
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document; raises json.JSONDecodeError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
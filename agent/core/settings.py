@@ -16,25 +16,40 @@ class Settings(BaseSettings):
     openai_base_url: str = "https://api.openai.com/v1"
     openai_model: str = "gpt-4o"
     openai_api_key: str = ""
+    llm_max_concurrency: int = 8  # in-flight completion requests, 0 = unlimited
 
     # Container settings
     container_name: str = "sys-agent-workspace"
     container_runtime: str = ""  # "docker" or "podman", run on host if empty
+    container_persistent_shell: bool = False  # reuse exec sessions across commands
+    container_login_shell: bool = True  # bash -l: source profiles on each exec
 
     # Agent settings
     tool_timeout: int = 60
     max_output_chars: int = 100_000
     web_search_proxy: str = ""
+    web_search_rate_limit: float = 1.0  # DDGS requests per second, 0 = unlimited
+    web_cache_ttl_seconds: float = 900.0  # reuse of web_search/fetch results, 0 = off
+    web_cache_max_entries: int = 256  # per tool
+    web_error_cache_ttl_seconds: float = 60.0  # reuse of failed fetches, 0 = off
+    web_cache_path: str = ""  # SQLite file persisting web results, "" = memory only
+    tool_schema_lazy_loading: bool = False  # advertise compact tool schemas
 
     # Workspace paths
     cwd: str = "./workspace"
     project_dir: str = Path(__file__).parent.parent.parent.resolve().as_posix()
     skills_dir: str = "./.skills"
     crons_dir: str = "./.cron"
+    prompt_cache_ttl_seconds: float = 60.0  # reuse of the skills prompt section
 
     # Autonomous mode settings
     wake_interval_seconds: int = 1800  # 30 minutes
 
+    # Scheduler settings
+    event_queue_maxsize: int = 256  # inbound events buffered before producers block
+    max_concurrent_dispatches: int = 16  # events routed concurrently, 0 = unlimited
+    max_sessions: int = 1024  # idle chat workers kept before LRU eviction, 0 = no cap
+
     # Context compression settings
     context_auto_compression_enabled: bool = False
     context_max_tokens: int = 128_000
@@ -56,7 +71,7 @@ class Settings(BaseSettings):
     webui_port: int = 8017
 
     model_config: ClassVar[SettingsConfigDict] = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", extra="ignore"
+        env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True
     )
 
 
@@ -21,6 +21,7 @@ from agent.messaging.gateway import create_gateway
 from agent.tools.registry import ToolRegistry
 from agent.tools.skill import SkillLoader
 from agent.tools.toolbox import register_default_tools
+from agent.tools.web import PageFetcher, WebCacheStore
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +36,9 @@ class App:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.event_queue: asyncio.Queue[AgentEvent] = asyncio.Queue()
+        self.event_queue: asyncio.Queue[AgentEvent] = asyncio.Queue(
+            maxsize=self.settings.event_queue_maxsize
+        )
 
         # Tool infrastructure
         self.runtime = (
@@ -43,14 +46,29 @@ class App:
                 container_name=self.settings.container_name,
                 runtime=self.settings.container_runtime,
                 max_output_chars=self.settings.max_output_chars,
+                persistent_shell=self.settings.container_persistent_shell,
+                login_shell=self.settings.container_login_shell,
             )
             if self.settings.container_runtime
             else HostRuntime(max_output_chars=self.settings.max_output_chars)
         )
         self.skill = SkillLoader(self.settings.skills_dir)
-        self.tool_registry = ToolRegistry()
+        self.tool_registry = ToolRegistry(
+            lazy_schemas=self.settings.tool_schema_lazy_loading
+        )
+        self.page_fetcher = PageFetcher(timeout=self.settings.tool_timeout)
+        self.web_store = (
+            WebCacheStore(self.settings.web_cache_path)
+            if self.settings.web_cache_path
+            else None
+        )
         register_default_tools(
-            self.tool_registry, self.runtime, self.skill, self.settings
+            self.tool_registry,
+            self.runtime,
+            self.skill,
+            self.settings,
+            self.page_fetcher,
+            self.web_store,
         )
 
         # Message gateway (inbound)
@@ -63,11 +81,14 @@ class App:
             self.settings, self.event_queue
         )
 
-        self.prompt_builder = SystemPromptBuilder(self.skill)
+        self.prompt_builder = SystemPromptBuilder(
+            self.skill, cache_ttl_seconds=self.settings.prompt_cache_ttl_seconds
+        )
 
         self.llm_client = OpenAIProvider(
             url=self.settings.openai_base_url,
             api_key=self.settings.openai_api_key,
+            max_concurrency=self.settings.llm_max_concurrency,
         )
         self.model_name = self.settings.openai_model
         self.agent = Agent(
@@ -91,3 +112,10 @@ class App:
             self.background_tasks.append(asyncio.create_task(self.api_service.run()))
         if self.gateway is not None:
             self.background_tasks.append(asyncio.create_task(self.gateway.run()))
+
+    async def close(self) -> None:
+        """Release pooled network resources and the web cache file."""
+        await self.llm_client.close()
+        await self.page_fetcher.close()
+        if self.web_store is not None:
+            self.web_store.close()
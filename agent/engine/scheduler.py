@@ -16,6 +16,7 @@ wraps aiocron and enqueues CronEvents onto the session's ConversationWorker.
 import asyncio
 import contextlib
 import logging
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from typing import Protocol
 
@@ -23,6 +24,7 @@ from agent.core.events import (
     AgentEvent,
     DropSessionEvent,
     HeartbeatEvent,
+    ImageInputEvent,
     NewSessionEvent,
     TextInputEvent,
 )
@@ -64,9 +66,21 @@ class Scheduler:
     def __init__(self, app: SchedulerContext) -> None:
         self.app = app
         self.running = True
-        self.workers = {}
-        self.cron_workers = {}
+        self.workers: OrderedDict[
+            str, tuple[ConversationWorker, asyncio.Task[None]]
+        ] = OrderedDict()
+        self.max_sessions = app.settings.max_sessions
+        self.cron_workers: dict[str, CronWorker] = {}
+        # 0 disables the limit, like llm_max_concurrency.
+        self.dispatch_slots: asyncio.Semaphore | None = (
+            asyncio.Semaphore(app.settings.max_concurrent_dispatches)
+            if app.settings.max_concurrent_dispatches > 0
+            else None
+        )
+        self.chat_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+        self.inflight: set[asyncio.Task[None]] = set()
         self.cron_loader = CronLoader(app.settings.crons_dir)
+        self.default_heartbeat_interval = app.settings.wake_interval_seconds
         self.text_commands: list[
             tuple[str, Callable[[TextInputEvent], Awaitable[None]]]
         ] = [
@@ -75,36 +89,63 @@ class Scheduler:
             ("/new", self._cmd_new),
             ("/drop", self._cmd_drop),
         ]
+        self.event_handlers: dict[type, Callable[..., Awaitable[None]]] = {
+            TextInputEvent: self._dispatch_text,
+            ImageInputEvent: self._forward,
+            DropSessionEvent: self._handle_drop_session,
+        }
 
     def _get_or_create_worker(self, chat_id: str) -> ConversationWorker:
         """Return the existing worker for *chat_id* or create and start a new one."""
-        if chat_id not in self.workers:
-            worker = ConversationWorker(
-                settings=self.app.settings,
-                agent=self.app.agent,
-                prompt_builder=self.app.prompt_builder,
-                orchestrator_factory=self.app.orchestrator_factory,
-            )
-            self.workers[chat_id] = (worker, asyncio.create_task(worker.run()))
-            logger.info(f"Started conversation worker for chat_id={chat_id}")
-        worker, _ = self.workers[chat_id]
+        entry = self.workers.get(chat_id)
+        if entry is not None:
+            self.workers.move_to_end(chat_id)
+            return entry[0]
+        worker = ConversationWorker(
+            settings=self.app.settings,
+            agent=self.app.agent,
+            prompt_builder=self.app.prompt_builder,
+            orchestrator_factory=self.app.orchestrator_factory,
+        )
+        self.workers[chat_id] = (worker, asyncio.create_task(worker.run()))
+        logger.info("Started conversation worker for chat_id=%s", chat_id)
+        self._evict_idle_workers(keep=chat_id)
         return worker
 
+    def _evict_idle_workers(self, keep: str) -> None:
+        """Drop least-recently-used idle sessions while over max_sessions.
+
+        Sessions with a heartbeat, loaded cron jobs or pending work are never
+        evicted, so the cap is soft when every session is active.
+        """
+        excess = len(self.workers) - self.max_sessions
+        if not self.max_sessions or excess <= 0:
+            return
+        evict = [
+            chat_id
+            for chat_id, (worker, _) in self.workers.items()
+            if chat_id != keep and chat_id not in self.cron_workers and worker.idle
+        ][:excess]
+        for chat_id in evict:
+            _, task = self.workers.pop(chat_id)
+            task.cancel()
+            logger.info("Evicted idle conversation worker for chat_id=%s", chat_id)
+
     def _get_or_create_cron_worker(self, chat_id: str) -> CronWorker:
         """Return the CronWorker for *chat_id*, creating one if needed."""
-        if chat_id not in self.cron_workers:
+        cron = self.cron_workers.get(chat_id)
+        if cron is None:
             worker = self._get_or_create_worker(chat_id)
-            self.cron_workers[chat_id] = CronWorker(
-                chat_id, worker.queue, self.cron_loader
-            )
-        return self.cron_workers[chat_id]
+            cron = CronWorker(chat_id, worker.queue, self.cron_loader)
+            self.cron_workers[chat_id] = cron
+        return cron
 
     async def _cmd_heartbeat(self, event: TextInputEvent) -> None:
         param = event.message[len("/heartbeat") :].strip()
         try:
             interval_seconds = int(param)
         except ValueError:
-            interval_seconds = self.app.settings.wake_interval_seconds
+            interval_seconds = self.default_heartbeat_interval
         await self._get_or_create_worker(event.chat_id).queue.put(
             HeartbeatEvent(
                 chat_id=event.chat_id,
@@ -193,47 +234,85 @@ class Scheduler:
 
     async def _cmd_drop(self, event: TextInputEvent) -> None:
         await event.sender.send(f"Dropping session chat_id={event.chat_id}")
-        await self.app.event_queue.put(DropSessionEvent(chat_id=event.chat_id))
+        # Handled inline: re-enqueueing onto the bounded event queue from its
+        # only consumer could block forever when the queue is full.
+        await self._handle_drop_session(DropSessionEvent(chat_id=event.chat_id))
 
     async def _handle_drop_session(self, event: DropSessionEvent) -> None:
         if event.chat_id in self.workers:
-            worker, task = self.workers.pop(event.chat_id)
-            if worker.heartbeat_task:
-                worker.heartbeat_task.cancel()
+            _, task = self.workers.pop(event.chat_id)
             task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await task
-            logger.info(f"Dropped session worker for chat_id={event.chat_id}")
+            logger.info("Dropped session worker for chat_id=%s", event.chat_id)
         else:
-            logger.debug(f"DropSessionEvent for unknown chat_id={event.chat_id}")
+            logger.debug("DropSessionEvent for unknown chat_id=%s", event.chat_id)
         cron = self.cron_workers.pop(event.chat_id, None)
         if cron:
             cron.unload_all()
 
+    async def _forward(self, event: TextInputEvent | ImageInputEvent) -> None:
+        """Enqueue *event* on its worker, dropping duplicated message deliveries."""
+        worker = self._get_or_create_worker(event.chat_id)
+        if worker.is_duplicate(event.message_id):
+            logger.debug("Ignoring duplicated message %s", event.message_id)
+            return
+        await worker.queue.put(event)
+
     async def _dispatch_text(self, event: TextInputEvent) -> None:
         """Route a TextInputEvent: intercept slash commands, forward the rest."""
         for prefix, handler in self.text_commands:
             if event.message.startswith(prefix):
                 await handler(event)
                 return
-        await self._get_or_create_worker(event.chat_id).queue.put(event)
+        await self._forward(event)
 
     async def _dispatch(self, event: AgentEvent) -> None:
         """Route an inbound event to the appropriate handler or worker queue."""
         try:
-            if isinstance(event, TextInputEvent):
-                await self._dispatch_text(event)
-            elif isinstance(event, DropSessionEvent):
-                await self._handle_drop_session(event)
+            handler = self.event_handlers.get(type(event))
+            if handler:
+                await handler(event)
             else:
-                await self._get_or_create_worker(event.chat_id).queue.put(event)
+                logger.warning("Unexpected event type in scheduler: %s", type(event))
         except Exception as e:
-            logger.error(f"Error during event dispatch: {e}", exc_info=True)
+            logger.error("Error during event dispatch: %s", e, exc_info=True)
+
+    async def _dispatch_ordered(self, event: AgentEvent) -> None:
+        """Dispatch *event* after earlier events for the same chat have finished.
+
+        asyncio.Lock wakes waiters in FIFO order, so per-chat ordering matches
+        the event queue while different chats dispatch concurrently.
+        """
+        chat_id = event.chat_id
+        lock, pending = self.chat_locks.get(chat_id, (asyncio.Lock(), 0))
+        self.chat_locks[chat_id] = (lock, pending + 1)
+        try:
+            async with lock:
+                await self._dispatch(event)
+        finally:
+            lock, pending = self.chat_locks[chat_id]
+            if pending == 1:
+                del self.chat_locks[chat_id]
+            else:
+                self.chat_locks[chat_id] = (lock, pending - 1)
+            if self.dispatch_slots is not None:
+                self.dispatch_slots.release()
+            self.app.event_queue.task_done()
 
     async def run(self) -> None:
-        """Consume from the shared event queue until stopped."""
+        """Consume from the shared event queue until stopped.
+
+        Each event is dispatched in its own task so a slow command reply for
+        one chat does not hold up routing for others. At most
+        max_concurrent_dispatches run at once (0 = unlimited); beyond that
+        the loop stops pulling from the queue.
+        """
         logger.info("Scheduler starting...")
         while self.running:
             event = await self.app.event_queue.get()
-            await self._dispatch(event)
-            self.app.event_queue.task_done()
+            if self.dispatch_slots is not None:
+                await self.dispatch_slots.acquire()
+            task = asyncio.create_task(self._dispatch_ordered(event))
+            self.inflight.add(task)
+            task.add_done_callback(self.inflight.discard)
@@ -11,10 +11,13 @@ per active session — and enqueues CronEvents onto the conversation queue.
 
 import asyncio
 import base64
+import functools
 import logging
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import aiocron
@@ -31,6 +34,7 @@ from agent.core.messaging import Channel
 from agent.core.settings import Settings
 from agent.llm.agent import (
     Agent,
+    BackgroundOrchestrator,
     OrchestratorFactory,
 )
 from agent.llm.prompt import SystemPromptBuilder
@@ -38,18 +42,54 @@ from agent.tools.cron import CronJobDef, CronLoader
 
 logger = logging.getLogger(__name__)
 
+MAX_TRACKED_MESSAGE_IDS = 4096
 
-@dataclass
+# User-message templates, parsed once; filled with str.format per event.
+_HEARTBEAT_TEMPLATE = "Current Time: {time}\nTimezone: {tz}\n\nSYSTEM EVENT: Heartbeat"
+_CRON_TEMPLATE = (
+    "Current Time: {time}\nTimezone: {tz}\n\n"
+    "SYSTEM EVENT: Scheduled task '{task_name}'\n\n{prompt}"
+)
+_MESSAGE_TEMPLATE = "Message Time: {time}\nTimezone: {tz}\n\n{message}"
+_IMAGE_MESSAGE_TEMPLATE = _MESSAGE_TEMPLATE + "\n"
+
+
+@dataclass(slots=True)
 class Conversation:
     messages: list[dict[str, Any]] = field(default_factory=list)
-    message_ids: set[str] = field(default_factory=set)
     total_tokens: int = 0
 
 
+@functools.lru_cache(maxsize=8)
+def _local_timezone(utc_offset: int, name: str) -> tuple[timezone, str]:
+    """Return a fixed-offset tzinfo and its "%Z%z" suffix for a local offset.
+
+    Keyed on the offset reported by time.localtime() so DST changes resolve
+    to a new entry instead of a stale cached zone.
+    """
+    tz = timezone(timedelta(seconds=utc_offset), name)
+    return tz, datetime.now(tz).strftime("%Z%z")
+
+
 def _format_current_datetime() -> tuple[datetime, str]:
     """Return the current localtime datetime object and a formatted string."""
-    now = datetime.now().astimezone()
-    return now, now.strftime("%Y-%m-%d %H:%M:%S %Z%z")
+    timestamp = time.time()
+    local = time.localtime(timestamp)
+    tz, suffix = _local_timezone(local.tm_gmtoff, local.tm_zone)
+    now = datetime.fromtimestamp(timestamp, tz)
+    return now, f"{now:%Y-%m-%d %H:%M:%S} {suffix}"
+
+
+def _estimate_tokens(message: dict[str, Any]) -> int:
+    """Roughly estimate the prompt tokens of a user message (~4 chars per token).
+
+    Only text parts are counted; image parts are priced by the provider and
+    show up in the next turn's reported usage.
+    """
+    content = message["content"]
+    if isinstance(content, str):
+        return len(content) // 4
+    return sum(len(part.get("text", "")) for part in content) // 4
 
 
 class ConversationWorker:
@@ -69,13 +109,25 @@ class ConversationWorker:
         orchestrator_factory: OrchestratorFactory,
     ) -> None:
         self.settings = settings
+        # Settings are fixed for the process lifetime; resolve per-turn values once.
+        # 0 disables compression, matching Agent.run's max_tokens convention.
+        self.compress_at_tokens = (
+            settings.context_max_tokens
+            if settings.context_auto_compression_enabled
+            else 0
+        )
+        self.keep_last = settings.context_num_keep_last
         self.agent = agent
         self.prompt_builder = prompt_builder
         self.orchestrator_factory = orchestrator_factory
         self.queue: asyncio.Queue[WorkerEvent] = asyncio.Queue()
         self.conversation = Conversation()
+        self.message_ids: OrderedDict[str, None] = OrderedDict()
         self.heartbeat_event: HeartbeatEvent | None = None
-        self.heartbeat_task: asyncio.Task[None] | None = None
+        self.background_orchestrator: BackgroundOrchestrator | None = None
+        self.heartbeat_timer: asyncio.TimerHandle | None = None
+        self.last_activity = 0.0
+        self.busy = False
         self.event_handlers: dict[type, Callable[..., Awaitable[None]]] = {
             HeartbeatEvent: self._process_heartbeat,
             CronEvent: self._process_cron,
@@ -84,40 +136,96 @@ class ConversationWorker:
             ImageInputEvent: self._process_image_input,
         }
 
+    @property
+    def idle(self) -> bool:
+        """True when nothing is queued, running, or scheduled for this worker."""
+        return not self.busy and self.queue.empty() and self.heartbeat_event is None
+
     async def _compress_conversation(self, sender: Channel) -> None:
         """Compress conversation history. Agent handles all message manipulation."""
-        logger.info(f"Compressing {len(self.conversation.messages)} messages")
+        logger.info("Compressing %d messages", len(self.conversation.messages))
         await sender.send("Context window full, compressing conversation…")
-        await self.agent.compress(
-            self.conversation.messages, self.settings.context_num_keep_last
-        )
+        await self.agent.compress(self.conversation.messages, self.keep_last)
         self.conversation.total_tokens = 0
-        self.conversation.message_ids = set()
         await sender.send("Conversation compressed")
 
-    async def _check_dedup_and_compress(self, message_id: str, sender: Channel) -> bool:
-        """Return False if duplicate; register and optionally compress, then return True."""
-        if message_id in self.conversation.message_ids:
-            logger.debug(f"Ignoring duplicated message {message_id}")
-            return False
-        self.conversation.message_ids.add(message_id)
+    def is_duplicate(self, message_id: str) -> bool:
+        """Return True if *message_id* was seen before; otherwise record it.
+
+        Called by the Scheduler before enqueueing so duplicated deliveries never
+        reach the worker queue. Only the most recent MAX_TRACKED_MESSAGE_IDS ids
+        are remembered; redeliveries arrive well within that window.
+        """
+        if message_id in self.message_ids:
+            self.message_ids.move_to_end(message_id)
+            return True
+        self.message_ids[message_id] = None
+        if len(self.message_ids) > MAX_TRACKED_MESSAGE_IDS:
+            self.message_ids.popitem(last=False)
+        return False
+
+    async def _maybe_compress(self, sender: Channel, incoming_tokens: int = 0) -> None:
+        """Compress the conversation if the next message would reach the threshold.
+
+        total_tokens is the usage reported for the previous turn; incoming_tokens
+        estimates the message about to be appended so compression happens before
+        the request that would overflow, not after it.
+        """
         if (
-            self.settings.context_auto_compression_enabled
+            self.compress_at_tokens
             and self.conversation.messages
-            and self.conversation.total_tokens >= self.settings.context_max_tokens
+            and self.conversation.total_tokens + incoming_tokens
+            >= self.compress_at_tokens
         ):
             await self._compress_conversation(sender)
-        return True
+
+    def _background_orchestrator(self, sender: Channel) -> BackgroundOrchestrator:
+        """Return the background orchestrator for *sender*, reusing the last one.
+
+        Recurring heartbeats and cron jobs deliver through the same channel every
+        cycle; the orchestrator holds no other per-turn state.
+        """
+        orchestrator = self.background_orchestrator
+        if orchestrator is None or orchestrator.sender is not sender:
+            orchestrator = self.orchestrator_factory.make_background(sender)
+            self.background_orchestrator = orchestrator
+        return orchestrator
 
     async def _process_new_session(self, event: NewSessionEvent) -> None:
         self.conversation = Conversation()
+        self.prompt_builder.invalidate()
         await event.sender.send("New session started")
 
-    async def _maybe_schedule_next_heartbeat(self) -> None:
-        if not self.heartbeat_event:
+    def _arm_heartbeat(self) -> None:
+        """Record activity and make sure a heartbeat timer is pending.
+
+        The timer is not cancelled per batch. It stays armed and, when it
+        fires, re-arms itself for the remaining idle time if there has been
+        activity since (see _on_heartbeat_timer). It is only replaced when the
+        new interval would make it fire later than required.
+        """
+        loop = asyncio.get_running_loop()
+        self.last_activity = loop.time()
+        if self.heartbeat_event is None:
             return
-        await asyncio.sleep(self.heartbeat_event.interval_seconds)
-        await self.queue.put(self.heartbeat_event)
+        deadline = self.last_activity + self.heartbeat_event.interval_seconds
+        if self.heartbeat_timer is not None:
+            if self.heartbeat_timer.when() <= deadline:
+                return
+            self.heartbeat_timer.cancel()
+        self.heartbeat_timer = loop.call_at(deadline, self._on_heartbeat_timer)
+
+    def _on_heartbeat_timer(self) -> None:
+        """Enqueue the heartbeat if idle long enough, else wait out the rest."""
+        self.heartbeat_timer = None
+        if self.heartbeat_event is None or self.busy:
+            return  # the running batch re-arms on completion
+        loop = asyncio.get_running_loop()
+        deadline = self.last_activity + self.heartbeat_event.interval_seconds
+        if loop.time() < deadline:
+            self.heartbeat_timer = loop.call_at(deadline, self._on_heartbeat_timer)
+        else:
+            self.queue.put_nowait(self.heartbeat_event)
 
     async def _process_heartbeat(self, event: HeartbeatEvent) -> None:
         if event.interval_seconds <= 0:
@@ -130,35 +238,34 @@ class ConversationWorker:
         self.conversation.messages = [
             {
                 "role": "user",
-                "content": f"""Current Time: {current_datetime}
-Timezone: {now.tzinfo}
-
-SYSTEM EVENT: Heartbeat""",
+                "content": _HEARTBEAT_TEMPLATE.format(
+                    time=current_datetime, tz=now.tzinfo
+                ),
             }
         ]
-        orchestrator = self.orchestrator_factory.make_background(event.sender)
+        orchestrator = self._background_orchestrator(event.sender)
         await self.agent.run(prompt, self.conversation.messages, orchestrator)
         logger.info("Heartbeat cycle completed")
 
     async def _process_cron(self, event: CronEvent) -> None:
-        logger.info(f"Processing cron task: {event.task_name}")
+        logger.info("Processing cron task: %s", event.task_name)
         prompt = self.prompt_builder.build_with_context(["CRON.md"])
         now, current_datetime = _format_current_datetime()
         self.conversation = Conversation()
         self.conversation.messages = [
             {
                 "role": "user",
-                "content": f"""Current Time: {current_datetime}
-Timezone: {now.tzinfo}
-
-SYSTEM EVENT: Scheduled task '{event.task_name}'
-
-{event.prompt}""",
+                "content": _CRON_TEMPLATE.format(
+                    time=current_datetime,
+                    tz=now.tzinfo,
+                    task_name=event.task_name,
+                    prompt=event.prompt,
+                ),
             }
         ]
-        orchestrator = self.orchestrator_factory.make_background(event.sender)
+        orchestrator = self._background_orchestrator(event.sender)
         await self.agent.run(prompt, self.conversation.messages, orchestrator)
-        logger.info(f"Cron task '{event.task_name}' completed")
+        logger.info("Cron task '%s' completed", event.task_name)
 
     async def _run_user_turn(self, message: dict[str, Any], sender: Channel) -> None:
         """Shared path for text and image input: append, run agent, track tokens."""
@@ -167,34 +274,26 @@ SYSTEM EVENT: Scheduled task '{event.task_name}'
 
         prompt = self.prompt_builder.build()
         orchestrator = self.orchestrator_factory.make_human_input(sender)
-        max_tokens = (
-            self.settings.context_max_tokens
-            if self.settings.context_auto_compression_enabled
-            else 0
-        )
         response = await self.agent.run(
             prompt,
             self.conversation.messages,
             orchestrator,
-            max_tokens,
-            self.settings.context_num_keep_last,
+            self.compress_at_tokens,
+            self.keep_last,
         )
         self.conversation.total_tokens = response.usage.total_tokens
         await sender.end_thinking()
 
     async def _process_text_input(self, event: TextInputEvent) -> None:
-        if not await self._check_dedup_and_compress(event.message_id, event.sender):
-            return
-
         now, current_datetime = _format_current_datetime()
         message: dict[str, Any] = {
             "role": "user",
-            "content": f"""Message Time: {current_datetime}
-Timezone: {now.tzinfo}
-
-{event.message}""",
+            "content": _MESSAGE_TEMPLATE.format(
+                time=current_datetime, tz=now.tzinfo, message=event.message
+            ),
         }
-        logger.info(f"Processing text input: {event.message[:100]}...")
+        await self._maybe_compress(event.sender, _estimate_tokens(message))
+        logger.info("Processing text input: %.100s...", event.message)
         await self._run_user_turn(message, event.sender)
         logger.info("Text input processing completed")
 
@@ -206,9 +305,6 @@ Timezone: {now.tzinfo}
             )
             return
 
-        if not await self._check_dedup_and_compress(event.message_id, event.sender):
-            return
-
         now, current_datetime = _format_current_datetime()
         image_b64 = base64.b64encode(event.image_data).decode()
         message: dict[str, Any] = {
@@ -216,11 +312,9 @@ Timezone: {now.tzinfo}
             "content": [
                 {
                     "type": "text",
-                    "text": f"""Message Time: {current_datetime}
-Timezone: {now.tzinfo}
-
-{event.message}
-""",
+                    "text": _IMAGE_MESSAGE_TEMPLATE.format(
+                        time=current_datetime, tz=now.tzinfo, message=event.message
+                    ),
                 },
                 {
                     "type": "image_url",
@@ -231,31 +325,81 @@ Timezone: {now.tzinfo}
                 },
             ],
         }
+        await self._maybe_compress(event.sender, _estimate_tokens(message))
         logger.info("Processing image input")
         await self._run_user_turn(message, event.sender)
         logger.info("Image input processing completed")
 
-    async def run(self) -> None:
-        """Process events from this worker's queue until cancelled."""
-        logger.info("Conversation worker started")
+    def _drain(self, first: WorkerEvent) -> list[WorkerEvent]:
+        """Return *first* plus every event already queued behind it."""
+        batch = [first]
         while True:
-            event = await self.queue.get()
-            if self.heartbeat_task:
-                self.heartbeat_task.cancel()
             try:
-                handler = self.event_handlers.get(type(event))
-                if handler:
-                    await handler(event)
-                else:
-                    logger.warning(f"Unexpected event type in worker: {type(event)}")
-            except Exception as e:
-                logger.error(f"Error in worker {event.chat_id}: {e}", exc_info=True)
-                await event.sender.send(f"Error during processing: {e}")
-            finally:
-                self.heartbeat_task = asyncio.create_task(
-                    self._maybe_schedule_next_heartbeat()
+                batch.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return batch
+
+    @staticmethod
+    def _coalesce(batch: list[WorkerEvent]) -> list[WorkerEvent]:
+        """Reduce a drained batch to the turns worth running.
+
+        All but the last HeartbeatEvent are dropped as superseded, and runs of
+        consecutive TextInputEvents are merged into one user turn that replies
+        through the latest message's channel.
+        """
+        last_heartbeat = max(
+            (i for i, event in enumerate(batch) if isinstance(event, HeartbeatEvent)),
+            default=-1,
+        )
+        coalesced: list[WorkerEvent] = []
+        for i, event in enumerate(batch):
+            if isinstance(event, HeartbeatEvent) and i != last_heartbeat:
+                continue
+            previous = coalesced[-1] if coalesced else None
+            if isinstance(event, TextInputEvent) and isinstance(
+                previous, TextInputEvent
+            ):
+                coalesced[-1] = replace(
+                    event, message=f"{previous.message}\n\n{event.message}"
                 )
-                self.queue.task_done()
+            else:
+                coalesced.append(event)
+        return coalesced
+
+    async def _handle(self, event: WorkerEvent) -> None:
+        try:
+            handler = self.event_handlers.get(type(event))
+            if handler:
+                await handler(event)
+            else:
+                logger.warning("Unexpected event type in worker: %s", type(event))
+        except Exception as e:
+            logger.error("Error in worker %s: %s", event.chat_id, e, exc_info=True)
+            await event.sender.send(f"Error during processing: {e}")
+
+    async def run(self) -> None:
+        """Process events from this worker's queue until cancelled.
+
+        Events that piled up during a turn are drained as one batch. The
+        heartbeat fires only after interval_seconds of idleness following
+        the last batch.
+        """
+        logger.info("Conversation worker started")
+        try:
+            while True:
+                batch = self._drain(await self.queue.get())
+                self.busy = True
+                try:
+                    for event in self._coalesce(batch):
+                        await self._handle(event)
+                finally:
+                    self.busy = False
+                    self._arm_heartbeat()
+                    for _ in batch:
+                        self.queue.task_done()
+        finally:
+            if self.heartbeat_timer:
+                self.heartbeat_timer.cancel()
 
 
 class CronWorker:
@@ -310,8 +454,10 @@ class CronWorker:
                 aiocron.crontab(job_def.cron_expr, func=make_callback())
             )
             logger.info(
-                f"Scheduled cron task '{job_def.task_name}' [{job_def.cron_expr}]"
-                f" for chat_id={self.chat_id}"
+                "Scheduled cron task '%s' [%s] for chat_id=%s",
+                job_def.task_name,
+                job_def.cron_expr,
+                self.chat_id,
             )
 
         self.jobs[job_name] = cron_objects
@@ -336,5 +482,5 @@ class CronWorker:
             return False
         for obj in cron_objs:
             obj.stop()
-        logger.info(f"Unloaded cron job '{job_name}' for chat_id={self.chat_id}")
+        logger.info("Unloaded cron job '%s' for chat_id=%s", job_name, self.chat_id)
         return True
@@ -18,6 +18,7 @@ from typing import Any, Protocol, override
 
 import jsonschema
 
+from agent.core import serialization
 from agent.core.messaging import Channel
 from agent.llm.prompt import SystemPromptBuilder
 from agent.llm.types import (
@@ -105,11 +106,11 @@ class Orchestrator(ABC):
                 ),
             )
 
-        logger.debug(f"Executing tool {tool_name} with args: {raw_arguments}")
+        logger.debug("Executing tool %s with args: %s", tool_name, raw_arguments)
         args: dict[str, Any] = {}
         tool_content: ToolContent
         try:
-            args = json.loads(raw_arguments)
+            args = serialization.loads(raw_arguments)
             validator = self.tool_registry.get_validator(tool_name)
             if validator:
                 validator.validate(args)
@@ -132,18 +133,23 @@ class Orchestrator(ABC):
 
         if tool_content.status == "error":
             logger.error(
-                f"Tool call {tool_name} failed: {tool_content.to_lm_content()}"
+                "Tool call %s failed: %s", tool_name, tool_content.to_lm_content()
             )
         else:
-            logger.debug(f"Tool call {tool_name} completed successfully")
+            logger.debug("Tool call %s completed successfully", tool_name)
 
         return ToolCallResult(tool_id, tool_name, args, tool_content)
 
 
+_THOUGHT_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+
+
 def _strip_thought(content: str | None) -> str:
     if not content:
         return ""
-    return re.sub(r"<think>.*?</think>", "", content, flags=re.DOTALL).strip()
+    if "<think>" not in content:
+        return content.strip()
+    return _THOUGHT_RE.sub("", content).strip()
 
 
 class SubagentOrchestrator(Orchestrator):
@@ -167,16 +173,15 @@ class SubagentOrchestrator(Orchestrator):
 
 
 def _register_agent_tool(
-    orchestrator: Orchestrator,
+    target: ToolRegistry,
     prompt_builder: SystemPromptBuilder,
     tool_registry: ToolRegistry,
     agent: Agent,
 ) -> None:
-    """Register the agent tool on an orchestrator's tool registry.
+    """Register the agent tool on *target*.
 
-    Snapshots the registry before the tool is added so the spawned
-    SubagentOrchestrator inherits all other tools but not this one,
-    preventing recursive subagent spawning.
+    Spawned SubagentOrchestrators get *tool_registry*, which must not contain
+    this tool, so they inherit all other tools but cannot spawn recursively.
     """
 
     async def run_agent(task: str, system_prompt: str) -> ToolContent:
@@ -200,7 +205,7 @@ def _register_agent_tool(
             "success", {"output": subagent_orchestrator.output}
         )
 
-    orchestrator.tool_registry.register(
+    target.register(
         run_agent,
         {
             "type": "object",
@@ -334,7 +339,7 @@ class Agent:
                 # extra_body={"chat_template_kwargs": {"enable_thinking": True}},
             )
 
-            logger.debug(f"LLM Response: {response}")
+            logger.debug("LLM Response: %s", response)
             choice = response.choices[0]
             message = choice.message
             finish_reason = choice.finish_reason
@@ -346,8 +351,9 @@ class Agent:
                 and response.usage.total_tokens >= max_tokens
             ):
                 logger.info(
-                    f"finish_reason={finish_reason!r}, compressing "
-                    f"({response.usage.total_tokens} tokens)"
+                    "finish_reason=%r, compressing (%d tokens)",
+                    finish_reason,
+                    response.usage.total_tokens,
                 )
                 await self.compress(messages, keep_last)
                 continue
@@ -451,7 +457,7 @@ class Agent:
                     name = tc.get("function", {}).get("name", "unknown")
                     raw_args = tc.get("function", {}).get("arguments") or ""
                     try:
-                        parsed = json.loads(raw_args) if raw_args else {}
+                        parsed = serialization.loads(raw_args) if raw_args else {}
                         args_str = ", ".join(
                             f"{k}={repr(v)[:80]}" for k, v in parsed.items()
                         )
@@ -482,7 +488,7 @@ class Agent:
         )
 
         new_summary = (response.choices[0].message.content or "").strip()
-        logger.info(f"Conversation compressed to {response.usage.total_tokens} tokens")
+        logger.info("Conversation compressed to %s tokens", response.usage.total_tokens)
 
         messages.clear()
         messages.append(
@@ -508,6 +514,10 @@ class DefaultOrchestratorFactory:
     model name, prompt builder, tool registry, and agent reference.
     _register_agent_tool is called here so orchestrators remain ignorant
     of Agent and SystemPromptBuilder.
+
+    The registry with the agent tool is built once. Background orchestrators
+    share it read-only; human-input orchestrators clone it because channels
+    register their own tools on it.
     """
 
     def __init__(
@@ -521,13 +531,15 @@ class DefaultOrchestratorFactory:
         self.prompt_builder = prompt_builder
         self.tool_registry = tool_registry
         self.agent = agent
+        self.orchestrator_registry = tool_registry.clone()
+        _register_agent_tool(
+            self.orchestrator_registry, prompt_builder, tool_registry, agent
+        )
 
     def make_human_input(self, sender: Channel) -> HumanInputOrchestrator:
-        orch = HumanInputOrchestrator(self.model, self.tool_registry.clone(), sender)
-        _register_agent_tool(orch, self.prompt_builder, self.tool_registry, self.agent)
-        return orch
+        return HumanInputOrchestrator(
+            self.model, self.orchestrator_registry.clone(), sender
+        )
 
     def make_background(self, sender: Channel) -> BackgroundOrchestrator:
-        orch = BackgroundOrchestrator(self.model, self.tool_registry.clone(), sender)
-        _register_agent_tool(orch, self.prompt_builder, self.tool_registry, self.agent)
-        return orch
+        return BackgroundOrchestrator(self.model, self.orchestrator_registry, sender)
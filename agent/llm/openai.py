@@ -1,8 +1,11 @@
+import asyncio
+import contextlib
 import logging
 from asyncio.exceptions import CancelledError
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 
-from openai import AsyncOpenAI, BadRequestError
+from openai import AsyncOpenAI, BadRequestError, DefaultAioHttpClient
 from tenacity import (
     before_sleep_log,
     retry,
@@ -60,15 +63,36 @@ def _normalize(response: Any) -> CompletionResponseView:
     )
 
 
+def _make_http_client() -> Any:
+    """Return an aiohttp-backed transport, or None for the SDK's httpx default.
+
+    The one provider instance is shared by every worker and orchestrator, so
+    this pool keeps connections to the LLM endpoint alive across turns.
+    """
+    try:
+        return DefaultAioHttpClient()
+    except RuntimeError:  # pragma: no cover - openai[aiohttp] extra missing
+        return None
+
+
 class OpenAIProvider:
     def __init__(
         self,
         url: str,
         api_key: str,
+        max_concurrency: int = 0,
     ):
         self.client: AsyncOpenAI = AsyncOpenAI(
             base_url=url,
             api_key=api_key,
+            http_client=_make_http_client(),
+        )
+        # Held only around the HTTP request, so retry back-off and tool
+        # execution never occupy a slot. 0 disables the limit.
+        self.slots: AbstractAsyncContextManager[Any] = (
+            asyncio.Semaphore(max_concurrency)
+            if max_concurrency > 0
+            else contextlib.nullcontext()
         )
 
     @retry(
@@ -77,7 +101,12 @@ class OpenAIProvider:
         before_sleep=before_sleep_log(logger, logging.WARNING),
     )
     async def do_completion(self, *args: Any, **kwargs: Any) -> CompletionResponseView:
-        response = await self.client.chat.completions.create(*args, **kwargs)
+        async with self.slots:
+            response = await self.client.chat.completions.create(*args, **kwargs)
         if not response.choices:
             raise Exception("Invalid response")
         return _normalize(response)
+
+    async def close(self) -> None:
+        """Close the pooled HTTP transport to the LLM endpoint."""
+        await self.client.close()
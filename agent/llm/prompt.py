@@ -1,4 +1,5 @@
 import platform
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -12,11 +13,22 @@ class _CachedFile:
 
 
 class SystemPromptBuilder:
-    """Builds the system prompt for the agent."""
+    """Builds the system prompt for the agent.
 
-    def __init__(self, skill: SkillLoader):
+    Workspace files are revalidated by mtime on every build so edits (e.g. to
+    MEMORY.md) show up on the next turn. The skills section, which requires
+    scanning every SKILL.md, is reused for cache_ttl_seconds.
+    """
+
+    def __init__(self, skill: SkillLoader, cache_ttl_seconds: float = 0.0):
         self.skill = skill
         self.file_cache: dict[str, _CachedFile] = {}
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.minimum_cache: tuple[float, str] | None = None
+
+    def invalidate(self) -> None:
+        """Drop the cached skills section so the next build rescans skills."""
+        self.minimum_cache = None
 
     def _load_file_cached(self, path: Path) -> str | None:
         """Return file content, using a cached value when mtime hasn't changed."""
@@ -41,6 +53,17 @@ class SystemPromptBuilder:
         return bootstrap_context
 
     def _build_minimum(self) -> str:
+        """Return the minimal system prompt, reusing it within the cache TTL."""
+        now = time.monotonic()
+        if self.minimum_cache is not None:
+            built_at, prompt = self.minimum_cache
+            if now - built_at < self.cache_ttl_seconds:
+                return prompt
+        prompt = self._render_minimum()
+        self.minimum_cache = (now, prompt)
+        return prompt
+
+    def _render_minimum(self) -> str:
         """Build a minimal system prompt without workspace context."""
         operating_system = platform.system()
         skill_summaries = self.skill.discover_skills()
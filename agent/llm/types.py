@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
+from agent.core.serialization import dumps
+
 
 @dataclass(slots=True)
 class ToolJsonResult:
@@ -38,9 +39,7 @@ class ToolContent:
         """Return the value expected by the OpenAI messages API."""
         if isinstance(self.result, ToolImageResult):
             return self.result.blocks
-        return json.dumps(
-            {"status": self.status, "result": self.result.result}, ensure_ascii=False
-        )
+        return dumps({"status": self.status, "result": self.result.result})
 
     @staticmethod
     def from_dict(
@@ -18,18 +18,23 @@ from agent.engine.scheduler import Scheduler
 
 logger = logging.getLogger("agent")
 
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+
 
 async def main() -> None:
     """Entry point: runs Scheduler + FastAPI server concurrently."""
     logger_stream = logging.StreamHandler()
-    logger_stream.setFormatter(
-        logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
-    )
+    logger_stream.setFormatter(_LOG_FORMATTER)
     logger.addHandler(logger_stream)
     logger.setLevel(logging.DEBUG)
 
+    # Run new tasks inline until their first suspension: dispatches that only
+    # enqueue or hit a fast path (duplicates, commands) finish without a loop
+    # round-trip.
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # Start dependent background tasks (messaging source, API server)
     app = App(get_settings())
     await app.run()
@@ -37,7 +42,10 @@ async def main() -> None:
     # Create and run scheduler
     scheduler = Scheduler(app)
     logger.info("Starting scheduler...")
-    await scheduler.run()
+    try:
+        await scheduler.run()
+    finally:
+        await app.close()
 
 
 if __name__ == "__main__":
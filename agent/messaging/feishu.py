@@ -70,7 +70,7 @@ class FeishuChannel(Channel):
         response = await self.client.im.v1.message.acreate(request)
         if not response.success():
             logger.error(
-                f"Failed to send Feishu message: {response.code} - {response.msg}"
+                "Failed to send Feishu message: %s - %s", response.code, response.msg
             )
 
     @override
@@ -85,7 +85,7 @@ class FeishuChannel(Channel):
         try:
             content = await self.runtime.read_raw_bytes(image_path)
         except Exception as e:
-            logger.error(f"Failed to read image file {image_path}: {e}")
+            logger.error("Failed to read image file %s: %s", image_path, e)
             raise
 
         if not content:
@@ -133,7 +133,7 @@ class FeishuChannel(Channel):
         try:
             content = await self.runtime.read_raw_bytes(file_path)
         except Exception as e:
-            logger.error(f"Failed to read file {file_path}: {e}")
+            logger.error("Failed to read file %s: %s", file_path, e)
             raise
 
         if not content:
@@ -193,7 +193,7 @@ class FeishuChannel(Channel):
         )
         response = await self.client.im.v1.message_reaction.acreate(request)
         if not response.success():
-            logger.error(f"Failed to add reaction: {response.code} - {response.msg}")
+            logger.error("Failed to add reaction: %s - %s", response.code, response.msg)
 
     @override
     def register_tools(self, registry: ToolRegistry) -> None:
@@ -209,7 +209,7 @@ class FeishuChannel(Channel):
                     "success", {"message": f"Added reaction {emoji} to message"}
                 )
             except Exception as e:
-                logger.error(f"Failed to add reaction {emoji}: {e}", exc_info=True)
+                logger.error("Failed to add reaction %s: %s", emoji, e, exc_info=True)
                 return ToolContent.from_dict("error", {"message": str(e)})
 
         registry.register(
@@ -332,7 +332,9 @@ class FeishuGateway(Gateway):
             response = await self.client.im.v1.message_resource.aget(request)
             if not response.success():
                 logger.error(
-                    f"Failed to download Feishu image: {response.code} - {response.msg}"
+                    "Failed to download Feishu image: %s - %s",
+                    response.code,
+                    response.msg,
                 )
                 return
             image_data = response.file.read()
@@ -345,13 +347,13 @@ class FeishuGateway(Gateway):
                 )
             )
         except Exception as e:
-            logger.error(f"Failed to download and queue image: {e}")
+            logger.error("Failed to download and queue image: %s", e)
 
     def _on_message(self, data: lark.im.v1.P2ImMessageReceiveV1) -> None:
         msg_type = data.event.message.message_type or ""
         content_json = data.event.message.content or "{}"
         content_dict = json.loads(content_json)
-        logger.info(f"Feishu event received (type={msg_type}): {content_json}")
+        logger.info("Feishu event received (type=%s): %s", msg_type, content_json)
 
         if not data.event.message.chat_id:
             return
@@ -2,6 +2,7 @@ import logging
 from typing import Any, override
 
 from agent.core.messaging import Channel
+from agent.core.serialization import dumps
 from agent.llm.types import ToolContent
 from agent.tools.registry import ToolRegistry
 
@@ -9,7 +10,11 @@ logger = logging.getLogger(__name__)
 
 
 class WebSocketChannel(Channel):
-    """Sends plain-text and image responses over a WebSocket connection."""
+    """Sends plain-text and image responses over a WebSocket connection.
+
+    Frames are encoded with agent.core.serialization, which uses orjson when
+    it is installed, and sent as text frames identical to send_json() output.
+    """
 
     def __init__(self, websocket: Any, chat_id: str, message_id: str = "") -> None:
         self.ws = websocket
@@ -18,25 +23,31 @@ class WebSocketChannel(Channel):
     @override
     async def send(self, text: str) -> None:
         try:
-            await self.ws.send_json(
-                {"type": "message", "chat_id": self.chat_id, "text": text}
+            await self.ws.send_text(
+                dumps({"type": "message", "chat_id": self.chat_id, "text": text})
             )
         except Exception as e:
-            logger.warning(f"WebSocket send failed for {self.chat_id}: {e}")
+            logger.warning("WebSocket send failed for %s: %s", self.chat_id, e)
 
     @override
     async def start_thinking(self) -> None:
         try:
-            await self.ws.send_json({"type": "thinking_start", "chat_id": self.chat_id})
+            await self.ws.send_text(
+                dumps({"type": "thinking_start", "chat_id": self.chat_id})
+            )
         except Exception as e:
-            logger.warning(f"WebSocket thinking_start failed for {self.chat_id}: {e}")
+            logger.warning(
+                "WebSocket thinking_start failed for %s: %s", self.chat_id, e
+            )
 
     @override
     async def end_thinking(self) -> None:
         try:
-            await self.ws.send_json({"type": "thinking_end", "chat_id": self.chat_id})
+            await self.ws.send_text(
+                dumps({"type": "thinking_end", "chat_id": self.chat_id})
+            )
         except Exception as e:
-            logger.warning(f"WebSocket thinking_end failed for {self.chat_id}: {e}")
+            logger.warning("WebSocket thinking_end failed for %s: %s", self.chat_id, e)
 
     @override
     def register_tools(self, registry: ToolRegistry) -> None:
@@ -47,15 +58,23 @@ class WebSocketChannel(Channel):
             Send an image file to the user. Image file size must be under 10 MiB.
             """
             try:
-                await self.ws.send_json(
-                    {"type": "image_path", "chat_id": self.chat_id, "path": image_path}
+                await self.ws.send_text(
+                    dumps(
+                        {
+                            "type": "image_path",
+                            "chat_id": self.chat_id,
+                            "path": image_path,
+                        }
+                    )
                 )
                 return ToolContent.from_dict(
                     "success",
                     {"message": f"Sent image {image_path} to user"},
                 )
             except Exception as e:
-                logger.warning(f"WebSocket image send failed for {self.chat_id}: {e}")
+                logger.warning(
+                    "WebSocket image send failed for %s: %s", self.chat_id, e
+                )
                 return ToolContent.from_dict("error", {"message": str(e)})
 
         registry.register(
@@ -1,5 +1,10 @@
 import re
 
+_FRONTMATTER_RE = re.compile(
+    r"^---[ \t]*\n(.*?)^---[ \t]*\n(.*)", re.DOTALL | re.MULTILINE
+)
+_KEY_RE = re.compile(r"\w+")
+
 
 def parse_frontmatter(content: str) -> tuple[dict[str, str], str]:
     """Extract YAML frontmatter from markdown content.
@@ -8,11 +13,7 @@ def parse_frontmatter(content: str) -> tuple[dict[str, str], str]:
     ({}, original_content).  Only simple 'key: value' pairs are supported;
     quoting is stripped from values.
     """
-    match = re.match(
-        r"^---[ \t]*\n(.*?)^---[ \t]*\n(.*)",
-        content,
-        re.DOTALL | re.MULTILINE,
-    )
+    match = _FRONTMATTER_RE.match(content)
     if not match:
         return {}, content
 
@@ -21,7 +22,8 @@ def parse_frontmatter(content: str) -> tuple[dict[str, str], str]:
 
     fm: dict[str, str] = {}
     for line in fm_text.splitlines():
-        m = re.match(r"^(\w+)\s*:\s*(.*?)\s*$", line)
-        if m:
-            fm[m.group(1)] = m.group(2).strip('"').strip("'")
+        key, sep, value = line.partition(":")
+        key = key.rstrip()
+        if sep and _KEY_RE.fullmatch(key):
+            fm[key] = value.strip().strip('"').strip("'")
     return fm, body
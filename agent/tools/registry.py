@@ -11,18 +11,58 @@ from typing import Any
 
 import jsonschema
 
+from agent.llm.types import ToolContent
+
 logger = logging.getLogger(__name__)
 
+DESCRIBE_TOOL_NAME = "describe_tool"
+
+
+def _strip_descriptions(node: Any) -> Any:
+    """Drop "description" keywords from a JSON schema, keeping property names."""
+    if isinstance(node, dict):
+        return {
+            key: (
+                {prop: _strip_descriptions(sub) for prop, sub in value.items()}
+                if key == "properties" and isinstance(value, dict)
+                else _strip_descriptions(value)
+            )
+            for key, value in node.items()
+            if key != "description"
+        }
+    if isinstance(node, list):
+        return [_strip_descriptions(item) for item in node]
+    return node
+
+
+def _compact_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Return a summary of a tool schema: first description paragraph, bare params."""
+    return {
+        "name": schema["name"],
+        "description": schema["description"].split("\n\n", 1)[0].strip(),
+        "parameters": _strip_descriptions(schema["parameters"]),
+    }
+
 
 class ToolRegistry:
     """
     Holds tool name -> (schema, handler, compiled validator) mappings.
+
+    With lazy_schemas enabled, tool_schemas() advertises compact summaries
+    and a describe_tool tool the model calls to fetch a full schema on demand.
+    The advertised tool list stays small and byte-stable across turns.
+    The list itself is built once and reused until the next register().
     """
 
-    def __init__(self):
+    def __init__(self, lazy_schemas: bool = False):
         self.schemas: dict[str, dict[str, Any]] = {}
+        self.compact_schemas: dict[str, dict[str, Any]] = {}
         self.handlers: dict[str, Callable[..., Awaitable[Any]]] = {}
         self.validators: dict[str, jsonschema.Draft7Validator] = {}
+        self.lazy_schemas = lazy_schemas
+        self.tool_payload: list[dict[str, Any]] | None = None
+        if lazy_schemas:
+            self._register_describe_tool()
 
     def register(
         self,
@@ -41,7 +81,10 @@ class ToolRegistry:
             "description": tool_description,
             "parameters": schema,
         }
+        if self.lazy_schemas and tool_name != DESCRIBE_TOOL_NAME:
+            self.compact_schemas[tool_name] = _compact_schema(self.schemas[tool_name])
         self.handlers[tool_name] = func
+        self.tool_payload = None
         if schema:
             self.validators[tool_name] = jsonschema.Draft7Validator(schema)
 
@@ -55,13 +98,61 @@ class ToolRegistry:
         return self.handlers.get(tool_name)
 
     def tool_schemas(self) -> list[dict[str, Any]]:
-        """Return all schemas formatted for the OpenAI tools API."""
-        return [{"type": "function", "function": fn} for fn in self.schemas.values()]
+        """Return all schemas formatted for the OpenAI tools API.
+
+        The returned list is shared between calls; callers must not mutate it.
+        """
+        if self.tool_payload is None:
+            self.tool_payload = [
+                {
+                    "type": "function",
+                    "function": (
+                        self.compact_schemas.get(name, fn) if self.lazy_schemas else fn
+                    ),
+                }
+                for name, fn in self.schemas.items()
+            ]
+        return self.tool_payload
 
     def clone(self) -> "ToolRegistry":
         """Return a shallow copy with independent tool mappings."""
         copy = ToolRegistry()
         copy.schemas = dict(self.schemas)
+        copy.compact_schemas = dict(self.compact_schemas)
         copy.handlers = dict(self.handlers)
         copy.validators = dict(self.validators)
+        copy.lazy_schemas = self.lazy_schemas
+        if self.lazy_schemas:
+            copy._register_describe_tool()
         return copy
+
+    def _register_describe_tool(self) -> None:
+        """Register describe_tool, bound to this registry's own mappings."""
+
+        async def describe_tool(name: str) -> ToolContent:
+            """
+            Return the full description and parameter schema of a tool.
+
+            Call this before using a tool whose parameters are unclear.
+            """
+            schema = self.schemas.get(name)
+            if schema is None:
+                return ToolContent.from_dict(
+                    "error", {"message": f"No such tool named {name}"}
+                )
+            return ToolContent.from_dict("success", schema)
+
+        self.register(
+            describe_tool,
+            {
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": "Name of the tool to describe.",
+                    },
+                },
+                "required": ["name"],
+            },
+            name=DESCRIBE_TOOL_NAME,
+        )
@@ -1,4 +1,5 @@
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -6,8 +7,11 @@ from agent.tools.markdown import parse_frontmatter
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from the head of a SKILL.md when only its frontmatter is needed.
+_FRONTMATTER_PROBE_BYTES = 4096
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SkillSummary:
     """Brief skill info for progressive disclosure."""
 
@@ -15,7 +19,7 @@ class SkillSummary:
     description: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Skill:
     """Full skill with complete instructions."""
 
@@ -25,48 +29,139 @@ class Skill:
     instructions: str
 
 
+def _read_frontmatter(skill_file: Path) -> str:
+    """Read *skill_file* up to the end of its frontmatter block.
+
+    Falls back to the whole file when the block does not close within the
+    first _FRONTMATTER_PROBE_BYTES.
+    """
+    with skill_file.open("rb") as f:
+        head = f.read(_FRONTMATTER_PROBE_BYTES)
+        if head.startswith(b"---"):
+            end = 3
+            while (end := head.find(b"\n---", end)) != -1:
+                eol = head.find(b"\n", end + 4)
+                if eol == -1:
+                    break
+                if not head[end + 4 : eol].strip(b" \t"):
+                    return head[: eol + 1].decode("utf-8")
+                end = eol
+        return (head + f.read()).decode("utf-8")
+
+
 class SkillLoader:
-    """Discovers and loads skills from a directory."""
+    """Discovers and loads skills from a directory.
+
+    Parsed summaries and loaded skills are cached per SKILL.md and
+    revalidated by mtime and size, so repeated discovery and loading only stat
+    unchanged files. Discovery also indexes skill names to their files for
+    load_skill.
+    """
 
     def __init__(self, skills_dir: str = ".skills"):
         self.skills_dir = Path(skills_dir)
+        self.summary_cache: dict[Path, tuple[int, int, SkillSummary | None]] = {}
+        self.skill_paths: dict[str, Path] = {}
+        self.skill_cache: dict[Path, tuple[int, int, Skill]] = {}
+
+    def _skill_files(self) -> list[tuple[Path, os.stat_result]]:
+        """Return (path, stat) for every <skills_dir>/<name>/SKILL.md.
+
+        Sorted by directory name: scandir order is filesystem-defined, and a
+        stable order keeps the skills section of the system prompt, and which
+        file wins a duplicate name, the same across runs.
+        """
+        skill_files: list[tuple[Path, os.stat_result]] = []
+        with os.scandir(self.skills_dir) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                skill_file = Path(entry.path, "SKILL.md")
+                try:
+                    skill_files.append((skill_file, skill_file.stat()))
+                except FileNotFoundError:
+                    continue
+        skill_files.sort(key=lambda item: item[0].parent.name)
+        return skill_files
+
+    def _summarize(self, skill_file: Path, st: os.stat_result) -> SkillSummary | None:
+        """Return the summary for *skill_file*, reparsing only when it changed."""
+        cached = self.summary_cache.get(skill_file)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        data, _ = parse_frontmatter(_read_frontmatter(skill_file))
+        name = data.get("name")
+        summary = (
+            SkillSummary(name=name, description=data.get("description", ""))
+            if name
+            else None
+        )
+        self.summary_cache[skill_file] = (st.st_mtime_ns, st.st_size, summary)
+        return summary
 
     def discover_skills(self) -> list[SkillSummary]:
         """Return brief summaries of all available skills."""
         summaries: list[SkillSummary] = []
-        if not self.skills_dir.exists():
-            logger.warning(f"Skills directory {self.skills_dir} does not exist.")
+        skill_paths: dict[str, Path] = {}
+        if not self.skills_dir.is_dir():
+            logger.warning("Skills directory %s does not exist.", self.skills_dir)
+            self.summary_cache.clear()
+            self.skill_cache.clear()
+            self.skill_paths = skill_paths
             return summaries
 
-        for skill_file in self.skills_dir.glob("*/SKILL.md"):
+        seen: set[Path] = set()
+        for skill_file, st in self._skill_files():
+            seen.add(skill_file)
             try:
-                content = skill_file.read_text(encoding="utf-8")
-                data, _ = parse_frontmatter(content)
-                name = data.get("name")
-                if name:
-                    summaries.append(
-                        SkillSummary(name=name, description=data.get("description", ""))
-                    )
+                summary = self._summarize(skill_file, st)
             except Exception as e:
-                logger.error(f"Failed to parse skill at {skill_file}: {e}")
-
+                logger.error("Failed to parse skill at %s: %s", skill_file, e)
+                continue
+            if summary:
+                summaries.append(summary)
+                skill_paths.setdefault(summary.name, skill_file)
+
+        for stale in self.summary_cache.keys() - seen:
+            del self.summary_cache[stale]
+        for stale in self.skill_cache.keys() - seen:
+            del self.skill_cache[stale]
+        self.skill_paths = skill_paths
         return summaries
 
+    def _load_indexed(self, name: str) -> Skill | None:
+        """Load *name* from the file recorded by the last discovery, if any."""
+        skill_file = self.skill_paths.get(name)
+        if skill_file is None:
+            return None
+        try:
+            st = skill_file.stat()
+            cached = self.skill_cache.get(skill_file)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return cached[2] if cached[2].name == name else None
+            content = skill_file.read_text(encoding="utf-8")
+            data, instructions = parse_frontmatter(content)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error("Failed to load skill %s from %s: %s", name, skill_file, e)
+            return None
+        if data.get("name") != name:
+            return None
+        skill = Skill(
+            name=name,
+            skill_dir=str(skill_file.parent),
+            description=data.get("description", ""),
+            instructions=instructions,
+        )
+        self.skill_cache[skill_file] = (st.st_mtime_ns, st.st_size, skill)
+        return skill
+
     def load_skill(self, name: str) -> Skill | None:
         """Load full skill instructions by name."""
-        # Find the directory that contains a SKILL.md with this name
-        for skill_file in self.skills_dir.glob("*/SKILL.md"):
-            try:
-                content = skill_file.read_text(encoding="utf-8")
-                data, instructions = parse_frontmatter(content)
-                if data.get("name") == name:
-                    return Skill(
-                        name=name,
-                        skill_dir=str(skill_file.parent),
-                        description=data.get("description", ""),
-                        instructions=instructions,
-                    )
-            except Exception as e:
-                logger.error(f"Failed to load skill {name} from {skill_file}: {e}")
-
-        return None
+        skill = self._load_indexed(name)
+        if skill is None:
+            # The index may be stale (skill added, renamed or removed); rescan.
+            self.discover_skills()
+            skill = self._load_indexed(name)
+        return skill
@@ -7,19 +7,27 @@ which executes them inside the workspace container.
 
 import asyncio
 import base64
+import itertools
 import logging
 import shlex
+import threading
 from pathlib import Path
 from typing import Any, cast
 
-import trafilatura
-from ddgs import DDGS
-
 from agent.core.runtime import Runtime
 from agent.core.settings import Settings
 from agent.llm.types import ToolContent
 from agent.tools.registry import ToolRegistry
 from agent.tools.skill import SkillLoader
+from agent.tools.web import (
+    PageFetcher,
+    RateLimiter,
+    SingleFlight,
+    TTLCache,
+    WebCacheStore,
+    normalize_query,
+    normalize_url,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,14 +40,129 @@ _MIME_TYPES: dict[str, str] = {
     ".webp": "image/webp",
 }
 
+# fetch_batch limits: URLs per call and downloads in flight at once.
+_FETCH_BATCH_MAX_URLS = 20
+_FETCH_BATCH_CONCURRENCY = 5
+# web_search requests allowed back to back before web_search_rate_limit applies.
+_SEARCH_BURST = 3
+
+
+def _extract_main_text(html: bytes, url: str) -> str | None:
+    """Extract a page's main text. Runs in a worker thread.
+
+    trafilatura (lxml, justext, courlan) is imported on first use so startup
+    does not pay for it when fetch is never called. Given bytes, it detects
+    the page encoding itself, including from <meta charset>.
+    """
+    import trafilatura
+
+    return trafilatura.extract(html, url=url)
+
 
 def register_default_tools(
     registry: ToolRegistry,
     runtime: Runtime,
     skill: SkillLoader,
     settings: Settings,
+    page_fetcher: PageFetcher,
+    web_store: WebCacheStore | None = None,
 ) -> None:
-    """Declaratively register all default tools into the registry."""
+    """Declaratively register all default tools into the registry.
+
+    With *web_store*, web_search and fetch results also persist on disk and
+    are reused after a restart.
+    """
+    search_cache: TTLCache[list[Any]] = TTLCache(
+        settings.web_cache_ttl_seconds, settings.web_cache_max_entries
+    )
+    # Outcome per URL: extracted text, or the error message of a failed fetch.
+    fetch_cache: TTLCache[tuple[str | None, str | None]] = TTLCache(
+        settings.web_cache_ttl_seconds, settings.web_cache_max_entries
+    )
+    # Concurrent calls for the same query or URL share one lookup.
+    search_flight: SingleFlight[list[Any]] = SingleFlight()
+    fetch_flight: SingleFlight[str | None] = SingleFlight()
+    # Paces DDGS requests below its throttling threshold; cache hits skip it.
+    search_limiter = RateLimiter(settings.web_search_rate_limit, _SEARCH_BURST)
+    # web_search_proxy may list several proxies, separated by commas.
+    search_proxies: list[str | None] = [
+        proxy.strip() for proxy in settings.web_search_proxy.split(",") if proxy.strip()
+    ] or [None]
+    ddgs_clients: list[Any] = []
+    ddgs_rotation = itertools.count()
+    ddgs_lock = threading.Lock()
+
+    async def _cache_get(cache: TTLCache[Any], namespace: str, key: str) -> Any:
+        """Look *key* up in memory, then in the persistent store."""
+        value = cache.get(key)
+        if value is None and web_store is not None:
+            try:
+                hit = await web_store.get(namespace, key)
+            except Exception as e:
+                logger.warning("Web cache lookup failed: %s", e)
+                return None
+            if hit is not None:
+                value, ttl = hit
+                cache.put(key, value, ttl_seconds=ttl)
+        return value
+
+    async def _cache_put(
+        cache: TTLCache[Any],
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Store *value* in memory and, when configured, on disk."""
+        cache.put(key, value, ttl_seconds=ttl_seconds)
+        ttl = cache.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if web_store is None or ttl <= 0 or cache.ttl_seconds <= 0:
+            return
+        try:
+            await web_store.put(namespace, key, value, ttl)
+        except Exception as e:
+            logger.warning("Web cache write failed: %s", e)
+
+    def _next_ddgs() -> Any:
+        """Return the next shared DDGS client, importing ddgs on first use.
+
+        There is one instance per configured proxy, each keeping its
+        per-engine HTTP clients and their keep-alive connections across
+        searches. Successive calls rotate through them round-robin. Called
+        from worker threads, so the import and client construction stay off
+        the event loop; the lock keeps concurrent first searches from
+        building the clients twice.
+        """
+        with ddgs_lock:
+            if not ddgs_clients:
+                from ddgs import DDGS
+
+                ddgs_clients.extend(
+                    cast(Any, DDGS(proxy=proxy, timeout=60))  # pyright: ignore[reportCallIssue]
+                    for proxy in search_proxies
+                )
+            return ddgs_clients[next(ddgs_rotation) % len(ddgs_clients)]
+
+    async def _search(query: str, key: str) -> list[Any]:
+        """Return search results for *query*, consulting the cache."""
+        cached = await _cache_get(search_cache, "search", key)
+        if cached is not None:
+            return cached
+        results: list[Any] = []
+        for attempt in range(len(search_proxies)):
+            await search_limiter.acquire()
+            try:
+                # text() already returns a list bounded by max_results.
+                results = await asyncio.to_thread(
+                    lambda: _next_ddgs().text(query, max_results=7, backend="google")
+                )
+                break
+            except Exception as e:
+                if attempt == len(search_proxies) - 1:
+                    raise
+                logger.warning("Web search failed, trying the next proxy: %s", e)
+        await _cache_put(search_cache, "search", key, results)
+        return results
 
     async def web_search(query: str) -> ToolContent:
         """
@@ -47,20 +170,50 @@ def register_default_tools(
 
         Returns a list of search results with titles, URLs, and snippets.
         """
+        key = normalize_query(query)
         try:
-            proxy = settings.web_search_proxy if settings.web_search_proxy else None
-
-            def _do_search() -> list[Any]:
-                with cast(Any, DDGS(proxy=proxy, timeout=60)) as ddgs:  # pyright: ignore[reportCallIssue]
-                    return [
-                        r for r in ddgs.text(query, max_results=7, backend="google")
-                    ]
-
-            results = await asyncio.to_thread(_do_search)
+            results = await search_flight.run(key, lambda: _search(query, key))
             return ToolContent.from_dict("success", {"results": results})
         except Exception as e:
             return ToolContent.from_dict("error", {"message": str(e)})
 
+    async def _fetch_text(url: str) -> str | None:
+        """Download *url* and extract its main text, consulting the cache."""
+        key = normalize_url(url)
+        return await fetch_flight.run(key, lambda: _load_page(url, key))
+
+    async def _load_page(url: str, key: str) -> str | None:
+        """Return the cached outcome for *key*, or download and extract *url*."""
+        cached = await _cache_get(fetch_cache, "fetch", key)
+        if cached is not None:
+            output, error = cached
+            if error is not None:
+                raise RuntimeError(error)
+            return output
+        try:
+            downloaded = await page_fetcher.fetch(url)
+        except Exception as e:
+            # Remember failures briefly so retries of a dead URL return at once.
+            await _cache_put(
+                fetch_cache,
+                "fetch",
+                key,
+                (None, str(e)),
+                ttl_seconds=settings.web_error_cache_ttl_seconds,
+            )
+            raise
+        output = await asyncio.to_thread(_extract_main_text, downloaded, url)
+        await _cache_put(
+            fetch_cache,
+            "fetch",
+            key,
+            (output, None),
+            ttl_seconds=None
+            if output is not None
+            else settings.web_error_cache_ttl_seconds,
+        )
+        return output
+
     async def fetch(url: str) -> ToolContent:
         """
         Fetches and extracts the main content from a web page.
@@ -68,12 +221,30 @@ def register_default_tools(
         Returns the extracted text content from the URL.
         """
         try:
-            downloaded = await asyncio.to_thread(trafilatura.fetch_url, url)
-            output = await asyncio.to_thread(trafilatura.extract, downloaded)
-            return ToolContent.from_dict("success", {"output": output})
+            return ToolContent.from_dict("success", {"output": await _fetch_text(url)})
         except Exception as e:
             return ToolContent.from_dict("error", {"message": str(e)})
 
+    async def fetch_batch(urls: list[str]) -> ToolContent:
+        """
+        Fetches several web pages concurrently and extracts their main content.
+
+        Prefer this over repeated fetch calls when you already know the URLs.
+        Returns one entry per URL, in order, with either the extracted text
+        or an error message.
+        """
+        semaphore = asyncio.Semaphore(_FETCH_BATCH_CONCURRENCY)
+
+        async def fetch_one(url: str) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    return {"url": url, "output": await _fetch_text(url)}
+                except Exception as e:
+                    return {"url": url, "error": str(e)}
+
+        results = await asyncio.gather(*(fetch_one(url) for url in urls))
+        return ToolContent.from_dict("success", {"results": results})
+
     async def run_command(command: str, timeout: int = 60) -> ToolContent:
         """
         Executes a shell command in the workspace container.
@@ -82,9 +253,10 @@ def register_default_tools(
         any shell command. The command runs inside the container.
         """
         try:
-            result = await asyncio.wait_for(runtime.execute(command), timeout=timeout)
+            async with asyncio.timeout(timeout):
+                result = await runtime.execute(command)
             return ToolContent.from_dict("success", result)
-        except asyncio.TimeoutError:
+        except TimeoutError:
             return ToolContent.from_dict(
                 "error", {"message": f"Command timed out after {timeout}s"}
             )
@@ -104,6 +276,18 @@ def register_default_tools(
         except Exception as e:
             return ToolContent.from_dict("error", {"message": str(e)})
 
+    async def write_files(files: list[dict[str, str]]) -> ToolContent:
+        """
+        Write several files in the workspace container in one step.
+
+        Prefer this over repeated write_file calls when creating or replacing
+        multiple files. Parent directories will be created if they don't exist.
+        """
+        try:
+            return ToolContent.from_dict("success", await runtime.write_files(files))
+        except Exception as e:
+            return ToolContent.from_dict("error", {"message": str(e)})
+
     async def read_file(
         filename: str, start_line: int = 1, limit: int = 500
     ) -> ToolContent:
@@ -288,6 +472,23 @@ def register_default_tools(
         },
     )
 
+    registry.register(
+        fetch_batch,
+        {
+            "type": "object",
+            "properties": {
+                "urls": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 1,
+                    "maxItems": _FETCH_BATCH_MAX_URLS,
+                    "description": "The URLs of the web pages to fetch.",
+                }
+            },
+            "required": ["urls"],
+        },
+    )
+
     registry.register(
         run_command,
         {
@@ -324,6 +525,35 @@ def register_default_tools(
         },
     )
 
+    registry.register(
+        write_files,
+        {
+            "type": "object",
+            "properties": {
+                "files": {
+                    "type": "array",
+                    "description": "The files to write.",
+                    "minItems": 1,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "filename": {
+                                "type": "string",
+                                "description": "Path to the file.",
+                            },
+                            "content": {
+                                "type": "string",
+                                "description": "The content to write.",
+                            },
+                        },
+                        "required": ["filename", "content"],
+                    },
+                },
+            },
+            "required": ["files"],
+        },
+    )
+
     registry.register(
         read_file,
         {
@@ -358,11 +588,13 @@ def register_default_tools(
                 "edits": {
                     "type": "array",
                     "description": "A list of one or more search-and-replace operations to apply sequentially.",
+                    "minItems": 1,
                     "items": {
                         "type": "object",
                         "properties": {
                             "search": {
                                 "type": "string",
+                                "minLength": 1,
                                 "description": "The exact snippet of code to look for. Must be a literal match, including whitespace and comments.",
                             },
                             "replace": {
@@ -0,0 +1,254 @@
+"""HTTP access and result caching for the web tools."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+
+from agent.core.serialization import dumps, loads
+
+_MAX_PAGE_BYTES = 20 * 1024 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+_USER_AGENT = "Mozilla/5.0 (compatible; my-agent)"
+
+T = TypeVar("T")
+
+
+class PageFetcher:
+    """Downloads web pages over one pooled aiohttp session.
+
+    The session is created on first use, inside the running event loop, and
+    kept until close() so repeated fetches reuse DNS lookups and keep-alive
+    connections instead of paying a TCP and TLS handshake each time.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self.session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": _USER_AGENT},
+            )
+        return self.session
+
+    async def fetch(self, url: str) -> bytes:
+        """Return the raw body of *url*. Raises on HTTP or network errors.
+
+        The body is read in chunks and the download is aborted once it passes
+        _MAX_PAGE_BYTES, whether or not the server sent a Content-Length.
+        It is returned undecoded: many pages declare their charset only in a
+        <meta> tag, or not at all, and the extractor sniffs it from the bytes.
+        """
+        async with self._get_session().get(url) as response:
+            response.raise_for_status()
+            if (response.content_length or 0) > _MAX_PAGE_BYTES:
+                raise ValueError(
+                    f"Page exceeds {_MAX_PAGE_BYTES} bytes: {response.content_length}"
+                )
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(_READ_CHUNK_BYTES):
+                body += chunk
+                if len(body) > _MAX_PAGE_BYTES:
+                    raise ValueError(f"Page exceeds {_MAX_PAGE_BYTES} bytes")
+            return bytes(body)
+
+    async def close(self) -> None:
+        """Close the pooled session, if one was opened."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+class TTLCache(Generic[T]):
+    """Bounded LRU cache whose entries expire ttl_seconds after insertion.
+
+    A zero ttl_seconds or max_entries disables caching. put() may give an
+    entry its own, typically shorter, TTL.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+
+    def get(self, key: str) -> T | None:
+        """Return the live value for *key*, or None on a miss or expiry."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: T, ttl_seconds: float | None = None) -> None:
+        """Store *value*, evicting the least recently used entry when full."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0 or self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        self.entries[key] = (time.monotonic() + ttl, value)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+class SingleFlight(Generic[T]):
+    """Runs at most one call per key at a time; concurrent callers share it.
+
+    Each caller awaits the shared call through asyncio.shield, so cancelling
+    one caller does not cancel the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self.calls: dict[str, asyncio.Future[T]] = {}
+
+    async def run(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of the in-flight call for *key*, starting *call* if none."""
+        future = self.calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self.calls[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def _finish(self, key: str, future: asyncio.Future[T]) -> None:
+        if self.calls.get(key) is future:
+            del self.calls[key]
+        if not future.cancelled():
+            # Mark the exception retrieved even if every caller went away.
+            future.exception()
+
+
+class RateLimiter:
+    """Token bucket pacing calls to *rate* per second, with bursts of *burst*.
+
+    Waiters are served in arrival order. A rate of 0 disables limiting.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a call may proceed and take its token."""
+        if self.rate <= 0:
+            return
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1.0
+                self.updated = time.monotonic()
+            self.tokens -= 1
+
+
+class WebCacheStore:
+    """SQLite file that keeps web tool results across restarts.
+
+    Values are stored as JSON under a (namespace, key) pair with a wall-clock
+    expiry. The database is opened on first use; queries run in a worker
+    thread so disk I/O never blocks the event loop.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.connection: sqlite3.Connection | None = None
+        self.lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            connection.execute(
+                "DELETE FROM cache WHERE expires_at <= ?", (time.time(),)
+            )
+            connection.commit()
+            self.connection = connection
+        return self.connection
+
+    def _get_sync(self, namespace: str, key: str) -> tuple[Any, float] | None:
+        with self.lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        remaining = row[1] - time.time()
+        return (loads(row[0]), remaining) if remaining > 0 else None
+
+    def _put_sync(
+        self, namespace: str, key: str, value: Any, ttl_seconds: float
+    ) -> None:
+        with self.lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                (namespace, key, time.time() + ttl_seconds, dumps(value)),
+            )
+            connection.commit()
+
+    async def get(self, namespace: str, key: str) -> tuple[Any, float] | None:
+        """Return (value, seconds left) for a live entry, or None."""
+        return await asyncio.to_thread(self._get_sync, namespace, key)
+
+    async def put(
+        self, namespace: str, key: str, value: Any, ttl_seconds: float
+    ) -> None:
+        """Store a JSON-serializable *value* for *ttl_seconds*."""
+        await asyncio.to_thread(self._put_sync, namespace, key, value, ttl_seconds)
+
+    def close(self) -> None:
+        """Close the database, if it was opened."""
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+
+def normalize_query(query: str) -> str:
+    """Cache key for a search query: case- and whitespace-insensitive."""
+    return " ".join(query.split()).lower()
+
+
+def normalize_url(url: str) -> str:
+    """Cache key for a URL: lowercased scheme and host, fragment dropped."""
+    parts = urlsplit(url.strip())
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, "")
+    )
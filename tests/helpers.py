@@ -0,0 +1,23 @@
+"""Shared test doubles."""
+
+from agent.core.messaging import Channel
+from agent.tools.registry import ToolRegistry
+
+
+class RecordingChannel(Channel):
+    """Channel that records sent texts."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def send(self, text: str) -> None:
+        self.sent.append(text)
+
+    async def start_thinking(self) -> None:
+        pass
+
+    async def end_thinking(self) -> None:
+        pass
+
+    def register_tools(self, registry: ToolRegistry) -> None:
+        pass
@@ -1,23 +1,22 @@
 """Unit tests for Agent.compress()."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
 from agent.llm.agent import Agent
 from agent.llm.types import ChoiceView, CompletionResponseView, MessageView, UsageView
+from agent.tools.registry import ToolRegistry
 
 
 def _make_agent() -> Agent:
-    """Create an Agent with a mocked LLM client."""
-    llm_client = MagicMock()
-    tool_registry = MagicMock()
-    tool_registry.schemas = {}
-    tool_registry.handlers = {}
+    """Create an Agent with a stub LLM client and an empty tool registry."""
+    llm_client = SimpleNamespace(do_completion=AsyncMock())
     return Agent(
-        llm_client=llm_client,
+        llm_client=llm_client,  # type: ignore[arg-type]
         model="test-model",
-        tool_registry=tool_registry,
+        tool_registry=ToolRegistry(),
     )
 
 
@@ -114,3 +114,28 @@ class TestHumanInputOrchestratorRegistersChannelTools:
         assert names == [], (
             "No tools should be registered for a no-op channel without a factory"
         )
+
+
+class TestDefaultOrchestratorFactory:
+    """The factory builds the agent-tool registry once and isolates channel tools."""
+
+    def test_channel_tools_do_not_leak_between_orchestrators(self) -> None:
+        from agent.llm.agent import DefaultOrchestratorFactory
+
+        factory = DefaultOrchestratorFactory(
+            model="test-model",
+            prompt_builder=None,  # pyright: ignore[reportArgumentType]
+            tool_registry=ToolRegistry(),
+            agent=None,  # pyright: ignore[reportArgumentType]
+        )
+
+        human = factory.make_human_input(_RichChannel())
+        background = factory.make_background(_NoOpChannel())
+
+        assert "ping" in human.tool_registry.handlers
+        assert "ping" not in background.tool_registry.handlers
+        assert "agent" in background.tool_registry.handlers
+        assert (
+            factory.make_background(_NoOpChannel()).tool_registry
+            is background.tool_registry
+        )
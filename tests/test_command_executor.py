@@ -6,12 +6,47 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from agent.core.runtime import (
+    _TRUNCATION_SUFFIX,
     AgentRuntimeException,
     ContainerRuntime,
+    HostRuntime,
     Runtime,
+    _find_closest_block,
+    _ShellSession,
 )
 
 
+def _streaming_process(
+    stdout: bytes, stderr: bytes = b"", returncode: int = 0
+) -> AsyncMock:
+    """Mock process whose output is read from its pipes rather than communicate()."""
+    process = AsyncMock()
+    process.stdout = asyncio.StreamReader()
+    process.stdout.feed_data(stdout)
+    process.stdout.feed_eof()
+    process.stderr = asyncio.StreamReader()
+    process.stderr.feed_data(stderr)
+    process.stderr.feed_eof()
+    process.returncode = returncode
+    return process
+
+
+async def _run_locally(
+    command: str, input_data: bytes | None = None
+) -> tuple[str, str, int | None]:
+    """Stand-in for ContainerRuntime._exec_in_container that runs on the host."""
+    process = await asyncio.create_subprocess_exec(
+        "bash",
+        "-c",
+        command,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate(input_data)
+    return stdout.decode(), stderr.decode(), process.returncode
+
+
 class TestContainerRuntime:
     """Tests for ContainerRuntime."""
 
@@ -35,9 +70,7 @@ class TestContainerRuntime:
         with patch("shutil.which", return_value="/usr/bin/podman"):
             runtime = ContainerRuntime("test-container")
 
-        mock_process = AsyncMock()
-        mock_process.communicate.return_value = (b"output\n", b"")
-        mock_process.returncode = 0
+        mock_process = _streaming_process(b"output\n")
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             result = await runtime.execute("ls -la")
@@ -45,15 +78,28 @@ class TestContainerRuntime:
         assert result["stdout"] == "output\n"
         assert result["return_code"] == 0
 
+    @pytest.mark.asyncio
+    async def test_execute_without_login_shell(self):
+        """Test that login_shell=False runs commands in a plain bash."""
+        with patch("shutil.which", return_value="/usr/bin/podman"):
+            runtime = ContainerRuntime("test-container", login_shell=False)
+
+        mock_process = _streaming_process(b"")
+
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=mock_process
+        ) as mock_create:
+            await runtime.execute("true")
+
+        assert mock_create.call_args.args[-3:] == ("bash", "-c", "true")
+
     @pytest.mark.asyncio
     async def test_execute_failure(self):
         """Test command execution failure."""
         with patch("shutil.which", return_value="/usr/bin/podman"):
             runtime = ContainerRuntime("test-container")
 
-        mock_process = AsyncMock()
-        mock_process.communicate.return_value = (b"", b"error message")
-        mock_process.returncode = 1
+        mock_process = _streaming_process(b"", b"error message", returncode=1)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             result = await runtime.execute("bad-command")
@@ -61,21 +107,33 @@ class TestContainerRuntime:
         assert result["return_code"] == 1
         assert "error message" in result["stderr"]
 
+    @pytest.mark.asyncio
+    async def test_execute_caps_buffered_output(self):
+        """Test that output past the truncation limit is discarded while read."""
+        with patch("shutil.which", return_value="/usr/bin/podman"):
+            runtime = ContainerRuntime("test-container", max_output_chars=10)
+
+        mock_process = _streaming_process(b"x" * 1_000_000)
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+            result = await runtime.execute("yes")
+
+        assert result["stdout"].startswith("x" * 10 + "\n\n(truncated")
+
     @pytest.mark.asyncio
     async def test_read_file_success(self):
         """Test successful file read with pagination metadata.
 
-        read_file now uses ``wc -l && sed`` inside the container, so the
-        mock stdout is the line-count on the first line followed by the
-        requested content.
+        read_file runs a single awk pass inside the container, so the mock
+        stdout is the requested content followed by the line count.
         """
         with patch("shutil.which", return_value="/usr/bin/podman"):
             runtime = ContainerRuntime("test-container")
 
-        wc_sed_output = "10\nline 1\nline 2\n"
+        awk_output = "line 1\nline 2\n10 0\n"
 
         mock_process = AsyncMock()
-        mock_process.communicate.return_value = (wc_sed_output.encode(), b"")
+        mock_process.communicate.return_value = (awk_output.encode(), b"")
         mock_process.returncode = 0
 
         with patch(
@@ -88,10 +146,11 @@ class TestContainerRuntime:
         assert result["total_lines"] == 10
         assert result["start_line"] == 1
         assert result["returned_lines"] == 2
+        assert "truncated" not in result
 
     @pytest.mark.asyncio
     async def test_write_file_success(self):
-        """Test successful file write (single exec call with mkdir+base64)."""
+        """Test successful file write (single exec call streaming raw bytes)."""
         with patch("shutil.which", return_value="/usr/bin/podman"):
             runtime = ContainerRuntime("test-container")
 
@@ -107,7 +166,7 @@ class TestContainerRuntime:
         assert result["message"] == "Content saved to test.txt"
         assert mock_create.call_count == 1
         assert mock_create.call_args.kwargs["stdin"] == asyncio.subprocess.PIPE
-        assert mock_process.communicate.call_args.kwargs["input"] is not None
+        assert mock_process.communicate.call_args.kwargs["input"] == b"content"
 
     @pytest.mark.asyncio
     async def test_edit_file_not_found(self):
@@ -115,7 +174,11 @@ class TestContainerRuntime:
         with patch("shutil.which", return_value="/usr/bin/podman"):
             runtime = ContainerRuntime("test-container")
 
-        # Mock read (base64) returning different content
+        # The in-container edit reports a mismatch, then the generic path's
+        # read (base64) returns different content
+        mock_process_edit = AsyncMock()
+        mock_process_edit.communicate.return_value = (b"", b"")
+        mock_process_edit.returncode = 3
         mock_process_base64 = AsyncMock()
         mock_process_base64.communicate.return_value = (
             b"ZGlmZmVyZW50IGNvbnRlbnQ=",
@@ -126,10 +189,211 @@ class TestContainerRuntime:
         with (
             patch(
                 "asyncio.create_subprocess_exec",
-                side_effect=[mock_process_base64],
+                side_effect=[mock_process_edit, mock_process_base64],
             ),
             pytest.raises(AgentRuntimeException, match="Could not find exact match"),
         ):
             await runtime.edit_file(
                 "test.txt", [{"search": "original", "replace": "replaced"}]
             )
+
+    @pytest.mark.asyncio
+    async def test_edit_file_in_container(self, tmp_path):
+        """Test that edits run in one exec and mismatches use the generic path."""
+        with patch("shutil.which", return_value="/usr/bin/podman"):
+            runtime = ContainerRuntime("test-container")
+        target = tmp_path / "f.txt"
+        target.write_text("héllo\r\nworld\n")
+        with patch.object(
+            runtime, "_exec_in_container", side_effect=_run_locally
+        ) as mock_exec:
+            await runtime.edit_file(
+                str(target), [{"search": "héllo", "replace": "hi ✓"}]
+            )
+            assert target.read_bytes() == "hi ✓\r\nworld\n".encode()
+            assert mock_exec.call_count == 1
+
+            with pytest.raises(
+                AgentRuntimeException, match="Could not find exact match"
+            ):
+                await runtime.edit_file(
+                    str(target), [{"search": "missing", "replace": "x"}]
+                )
+            assert mock_exec.call_args_list[1].args[0].startswith("python3")
+            assert mock_exec.call_args_list[2].args[0].startswith("base64")
+
+    @pytest.mark.asyncio
+    async def test_write_files_in_container(self, tmp_path):
+        """Test that a batch is written in one exec, falling back per file."""
+        with patch("shutil.which", return_value="/usr/bin/podman"):
+            runtime = ContainerRuntime("test-container")
+        files = [
+            {"filename": str(tmp_path / "a.txt"), "content": "one\r\n"},
+            {"filename": str(tmp_path / "sub" / "b.txt"), "content": "twö"},
+        ]
+        with patch.object(
+            runtime, "_exec_in_container", side_effect=_run_locally
+        ) as mock_exec:
+            await runtime.write_files(files)
+            assert mock_exec.call_count == 1
+            assert (tmp_path / "a.txt").read_bytes() == b"one\r\n"
+            assert (tmp_path / "sub" / "b.txt").read_text() == "twö"
+
+            (tmp_path / "blocked").write_text("")
+            with pytest.raises(AgentRuntimeException):
+                await runtime.write_files(
+                    [{"filename": str(tmp_path / "blocked" / "c.txt"), "content": ""}]
+                )
+            assert mock_exec.call_args_list[1].args[0].startswith("python3")
+            assert mock_exec.call_args_list[2].args[0].startswith("mkdir")
+
+
+class TestHostRuntime:
+    """Tests for HostRuntime."""
+
+    @pytest.mark.asyncio
+    async def test_execute_timeout_kills_process(self):
+        """Test that a timed-out command is killed rather than left running."""
+        runtime = HostRuntime()
+        processes: list[asyncio.subprocess.Process] = []
+        create = asyncio.create_subprocess_shell
+
+        async def spawn(*args, **kwargs):
+            process = await create(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        with (
+            patch("asyncio.create_subprocess_shell", side_effect=spawn),
+            pytest.raises(asyncio.TimeoutError),
+        ):
+            await asyncio.wait_for(runtime.execute("sleep 30"), timeout=0.2)
+
+        assert processes[0].returncode is not None
+
+    @pytest.mark.asyncio
+    async def test_edit_file_replaces_single_occurrence(self, tmp_path):
+        """Test that edit_file splices a unique block and rejects ambiguous ones."""
+        target = tmp_path / "f.txt"
+        target.write_text("alpha\nbeta\ngamma\nbeta\n")
+        runtime = HostRuntime()
+
+        await runtime.edit_file(str(target), [{"search": "alpha", "replace": "A"}])
+        assert target.read_text() == "A\nbeta\ngamma\nbeta\n"
+
+        with pytest.raises(AgentRuntimeException, match="Multiple occurrences"):
+            await runtime.edit_file(str(target), [{"search": "beta", "replace": "B"}])
+        assert target.read_text() == "A\nbeta\ngamma\nbeta\n"
+
+    @pytest.mark.asyncio
+    async def test_read_file_slice(self, tmp_path):
+        """Test that read_file returns the requested slice and the total count."""
+        target = tmp_path / "f.txt"
+        target.write_text("".join(f"line {i}\n" for i in range(1, 11)))
+        runtime = HostRuntime()
+
+        result = await runtime.read_file(str(target), start_line=3, limit=2)
+
+        assert result == {
+            "content": "line 3\nline 4\n",
+            "total_lines": 10,
+            "start_line": 3,
+            "returned_lines": 2,
+        }
+        with pytest.raises(AgentRuntimeException, match="File not found"):
+            await runtime.read_file(str(tmp_path / "missing.txt"))
+
+    @pytest.mark.asyncio
+    async def test_read_file_stops_at_size_cap(self, tmp_path):
+        """Test that a slice larger than the cap is cut and flagged."""
+        target = tmp_path / "f.txt"
+        target.write_text("aaaa\nbbbb\ncccc\n")
+        runtime = HostRuntime()
+
+        with patch("agent.core.runtime._MAX_READ_CHARS", 10):
+            result = await runtime.read_file(str(target))
+            assert result["content"] == "aaaa\nbbbb\n"
+            assert result["total_lines"] == 3
+            assert result["truncated"] is True
+
+            target.write_text("x" * 25 + "\nshort\n")
+            result = await runtime.read_file(str(target))
+            assert result["content"] == "x" * 10 + "\n"
+            assert result["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_execute_caps_buffered_output(self):
+        """Test that a command printing far past the limit is truncated."""
+        runtime = HostRuntime(max_output_chars=100)
+
+        result = await runtime.execute("head -c 5000000 /dev/zero | tr '\\0' x")
+
+        assert result["stdout"] == "x" * 100 + _TRUNCATION_SUFFIX
+
+
+class TestShellSession:
+    """Tests for the persistent shell used by ContainerRuntime."""
+
+    @pytest.mark.asyncio
+    async def test_run_isolates_commands(self):
+        """Test output framing, exit codes and per-command isolation."""
+        shell = await _ShellSession.start(["bash"])
+        try:
+            assert await shell.run("echo out; echo err >&2; exit 3") == (
+                b"out\n",
+                b"err\n",
+                3,
+            )
+            assert await shell.run("cd / && printf partial") == (b"partial", b"", 0)
+            stdout, _, _ = await shell.run("pwd")
+            assert stdout != b"/\n"
+            assert await shell.run("read line; echo got=$line") == (b"got=\n", b"", 0)
+            stdout, _, _ = await shell.run("head -c 1000000 /dev/zero", max_bytes=10)
+            assert stdout == b"\0" * 10
+            assert await shell.run("echo after") == (b"after\n", b"", 0)
+        finally:
+            await shell.close()
+
+    @pytest.mark.asyncio
+    async def test_container_runtime_reuses_session(self):
+        """Test that sequential commands share one pooled session."""
+        with patch("shutil.which", return_value="/usr/bin/podman"):
+            runtime = ContainerRuntime("test-container", persistent_shell=True)
+
+        start = _ShellSession.start
+
+        async def start_local(argv: list[str]) -> _ShellSession:
+            return await start(["bash"])
+
+        with patch.object(
+            _ShellSession, "start", side_effect=start_local
+        ) as mock_start:
+            first = await runtime.execute("echo one")
+            second = await runtime.execute("echo two")
+
+        assert first["stdout"] == "one\n"
+        assert second["stdout"] == "two\n"
+        assert mock_start.call_count == 1
+        assert mock_start.call_args.args[0][:3] == ["/usr/bin/podman", "exec", "-i"]
+        for shell in runtime.idle_shells:
+            await shell.close()
+
+
+class TestFindClosestBlock:
+    """Tests for the edit_file mismatch hint."""
+
+    def test_whitespace_only_mismatch(self):
+        """Test that a re-indented block is found by the linear pre-pass."""
+        content = "def f():\n    x = 1\n    return x\n"
+        assert (
+            _find_closest_block(content, "x = 1\nreturn x") == "    x = 1\n    return x"
+        )
+
+    def test_fuzzy_match(self):
+        """Test the SequenceMatcher fallback for near misses."""
+        content = "alpha\nvalue = compute(a, b)\nomega\n"
+        assert (
+            _find_closest_block(content, "value = compute(a, c)")
+            == "value = compute(a, b)"
+        )
+        assert _find_closest_block(content, "zzzzzzzzzzzzzzzz") is None
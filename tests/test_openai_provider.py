@@ -0,0 +1,56 @@
+"""Tests for OpenAIProvider."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agent.llm.openai import OpenAIProvider
+
+
+def _response() -> SimpleNamespace:
+    message = SimpleNamespace(role="assistant", content="ok", tool_calls=None)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(index=0, finish_reason="stop", message=message)],
+        usage=None,
+        model="test-model",
+    )
+
+
+class TestOpenAIProvider:
+    """Tests for OpenAIProvider concurrency limiting."""
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_caps_in_flight_requests(self):
+        """No more than max_concurrency completions run at once."""
+        provider = OpenAIProvider("http://localhost", "key", max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def create(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _response()
+
+        provider.client = SimpleNamespace(  # pyright: ignore[reportAttributeAccessIssue]
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+        results = await asyncio.gather(
+            *(provider.do_completion(model="m", messages=[]) for _ in range(5))
+        )
+
+        assert peak == 2
+        assert [r.choices[0].message.content for r in results] == ["ok"] * 5
+
+    @pytest.mark.asyncio
+    async def test_close_closes_http_client(self):
+        """close() releases the underlying HTTP transport."""
+        provider = OpenAIProvider("http://localhost", "key")
+
+        await provider.close()
+
+        assert provider.client.is_closed()
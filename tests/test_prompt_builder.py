@@ -0,0 +1,49 @@
+"""Tests for SystemPromptBuilder caching."""
+
+from agent.llm.prompt import SystemPromptBuilder
+from agent.tools.skill import SkillLoader
+
+
+def _write_skill(root, name: str) -> None:
+    skill_dir = root / name
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {name} skill\n---\n\nBody.\n"
+    )
+
+
+class TestSystemPromptBuilder:
+    """Tests for SystemPromptBuilder."""
+
+    def test_skills_section_cached_until_invalidated(self, tmp_path):
+        """New skills appear only after the TTL expires or invalidate()."""
+        _write_skill(tmp_path, "alpha")
+        builder = SystemPromptBuilder(SkillLoader(str(tmp_path)), cache_ttl_seconds=60)
+
+        assert "- alpha: alpha skill" in builder.build()
+
+        _write_skill(tmp_path, "beta")
+        assert "beta" not in builder.build()
+
+        builder.invalidate()
+        assert "- beta: beta skill" in builder.build()
+
+    def test_zero_ttl_rescans_every_build(self, tmp_path):
+        """The default TTL of 0 keeps the previous uncached behaviour."""
+        builder = SystemPromptBuilder(SkillLoader(str(tmp_path)))
+        builder.build()
+
+        _write_skill(tmp_path, "gamma")
+        assert "- gamma: gamma skill" in builder.build()
+
+    def test_workspace_files_revalidated_despite_cache(self, tmp_path, monkeypatch):
+        """Workspace file edits bypass the skills TTL."""
+        monkeypatch.chdir(tmp_path)
+        builder = SystemPromptBuilder(
+            SkillLoader(str(tmp_path / ".skills")), cache_ttl_seconds=60
+        )
+        (tmp_path / "MEMORY.md").write_text("first")
+        assert "first" in builder.build()
+
+        (tmp_path / "MEMORY.md").write_text("second, longer")
+        assert "second, longer" in builder.build()
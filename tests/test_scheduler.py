@@ -0,0 +1,152 @@
+"""Tests for Scheduler event routing."""
+
+import asyncio
+import contextlib
+from types import SimpleNamespace
+
+import pytest
+
+from agent.core.events import HeartbeatEvent, TextInputEvent
+from agent.engine.scheduler import Scheduler
+from tests.helpers import RecordingChannel
+
+
+@pytest.fixture
+def scheduler(mock_settings):
+    app = SimpleNamespace(
+        settings=mock_settings,
+        agent=None,
+        prompt_builder=None,
+        orchestrator_factory=None,
+        event_queue=asyncio.Queue(maxsize=mock_settings.event_queue_maxsize),
+    )
+    return Scheduler(app)  # pyright: ignore[reportArgumentType]
+
+
+async def _shutdown(scheduler: Scheduler) -> None:
+    for _, task in scheduler.workers.values():
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+class TestScheduler:
+    """Tests for Scheduler dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_message_not_enqueued(self, scheduler):
+        """A redelivered message_id is dropped before reaching the worker queue."""
+        sender = RecordingChannel()
+        event = TextInputEvent(
+            chat_id="c1", message_id="m1", message="hello", sender=sender
+        )
+
+        await scheduler._dispatch(event)
+        await scheduler._dispatch(event)
+
+        worker, _ = scheduler.workers["c1"]
+        assert worker.queue.qsize() == 1
+        await _shutdown(scheduler)
+
+    @pytest.mark.asyncio
+    async def test_drop_command_tears_down_worker(self, scheduler):
+        """/drop removes the worker without re-enqueueing onto the event queue."""
+        sender = RecordingChannel()
+        await scheduler._dispatch(
+            TextInputEvent(chat_id="c1", message_id="m1", message="hi", sender=sender)
+        )
+        await scheduler._dispatch(
+            TextInputEvent(
+                chat_id="c1", message_id="m2", message="/drop", sender=sender
+            )
+        )
+
+        assert "c1" not in scheduler.workers
+        assert scheduler.app.event_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_slow_chat_does_not_block_other_chats(self, scheduler):
+        """Dispatch runs concurrently across chats but in order within a chat."""
+        sender = RecordingChannel()
+        release = asyncio.Event()
+        dispatched: list[str] = []
+
+        async def fake_dispatch(event: TextInputEvent) -> None:
+            if event.message_id == "a1":
+                await release.wait()
+            dispatched.append(event.message_id)
+
+        scheduler._dispatch = fake_dispatch
+        for chat_id, message_id in (("a", "a1"), ("a", "a2"), ("b", "b1")):
+            scheduler.app.event_queue.put_nowait(
+                TextInputEvent(
+                    chat_id=chat_id, message_id=message_id, message="x", sender=sender
+                )
+            )
+
+        runner = asyncio.create_task(scheduler.run())
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert dispatched == ["b1"]
+
+        release.set()
+        await scheduler.app.event_queue.join()
+        assert dispatched == ["b1", "a1", "a2"]
+        assert scheduler.chat_locks == {}
+
+        runner.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await runner
+
+    @pytest.mark.asyncio
+    async def test_zero_dispatch_limit_is_unlimited(self, mock_settings):
+        """max_concurrent_dispatches=0 disables the cap instead of blocking."""
+        settings = mock_settings.model_copy(update={"max_concurrent_dispatches": 0})
+        app = SimpleNamespace(settings=settings, event_queue=asyncio.Queue())
+        scheduler = Scheduler(app)  # pyright: ignore[reportArgumentType]
+        sender = RecordingChannel()
+        dispatched: list[str] = []
+
+        async def fake_dispatch(event: TextInputEvent) -> None:
+            dispatched.append(event.message_id)
+
+        scheduler._dispatch = fake_dispatch
+        for chat_id in ("a", "b", "c"):
+            app.event_queue.put_nowait(
+                TextInputEvent(
+                    chat_id=chat_id, message_id=chat_id, message="x", sender=sender
+                )
+            )
+
+        runner = asyncio.create_task(scheduler.run())
+        await asyncio.wait_for(app.event_queue.join(), timeout=1)
+        assert sorted(dispatched) == ["a", "b", "c"]
+
+        runner.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await runner
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_evicted_beyond_cap(self, scheduler):
+        """The least-recently-used idle worker is dropped once over max_sessions."""
+        scheduler.max_sessions = 2
+        scheduler._get_or_create_worker("a")
+        scheduler._get_or_create_worker("b")
+        scheduler._get_or_create_worker("a")
+        scheduler._get_or_create_worker("c")
+
+        assert list(scheduler.workers) == ["a", "c"]
+        await _shutdown(scheduler)
+
+    @pytest.mark.asyncio
+    async def test_sessions_with_heartbeat_are_not_evicted(self, scheduler):
+        """Workers with a scheduled heartbeat survive eviction."""
+        scheduler.max_sessions = 1
+        worker = scheduler._get_or_create_worker("a")
+        worker.heartbeat_event = HeartbeatEvent(
+            chat_id="a", interval_seconds=60, sender=RecordingChannel()
+        )
+        scheduler._get_or_create_worker("b")
+
+        assert list(scheduler.workers) == ["a", "b"]
+        await _shutdown(scheduler)
@@ -0,0 +1,41 @@
+"""Tests for the JSON serialization helpers."""
+
+import json
+
+import pytest
+
+from agent.core import serialization
+from agent.llm.types import ToolContent
+
+
+class TestSerialization:
+    """Tests for dumps/loads across backends."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dumps_is_compact_and_keeps_unicode(self, monkeypatch, use_orjson):
+        """Both backends produce the same compact, non-escaped output."""
+        if not use_orjson:
+            monkeypatch.setattr(serialization, "orjson", None)
+        payload = {"status": "success", "result": {"text": "héllo 世界", "n": 1}}
+
+        assert (
+            serialization.dumps(payload)
+            == '{"status":"success","result":{"text":"héllo 世界","n":1}}'
+        )
+
+    def test_dumps_falls_back_for_non_str_keys(self):
+        """Payloads orjson rejects are still serialized by the stdlib."""
+        assert serialization.dumps({1: "a"}) == '{"1":"a"}'
+
+    def test_loads_raises_stdlib_decode_error(self):
+        """Callers can keep catching json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads("{not json")
+
+    def test_tool_content_round_trips(self):
+        """ToolContent text payloads parse back to the original dict."""
+        content = ToolContent.from_dict("error", {"message": "boom"})
+        assert serialization.loads(content.to_lm_content()) == {  # pyright: ignore[reportArgumentType]
+            "status": "error",
+            "result": {"message": "boom"},
+        }
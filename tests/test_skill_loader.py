@@ -41,6 +41,18 @@ Instructions here.
         assert summaries[0].name == "my-skill"
         assert summaries[0].description == "A test skill"
 
+    def test_discover_skills_sorted_by_directory(self, tmp_path):
+        """Test that summaries come back in directory-name order."""
+        for name in ["zeta", "alpha", "mid"]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "SKILL.md").write_text(
+                f"---\nname: {name}\ndescription: d\n---\n"
+            )
+
+        loader = SkillLoader(str(tmp_path))
+
+        assert [s.name for s in loader.discover_skills()] == ["alpha", "mid", "zeta"]
+
     def test_load_skill_not_found(self, tmp_path):
         """Test loading a skill that doesn't exist."""
         loader = SkillLoader(str(tmp_path))
@@ -89,3 +101,88 @@ Body
         assert fm["name"] == "quoted-name"
         assert fm["description"] == "single quoted"
         assert body == "Body"
+
+    def test_discover_skills_reparses_changed_file(self, tmp_path):
+        """Test that cached summaries are refreshed when SKILL.md changes."""
+        skill_dir = tmp_path / "my-skill"
+        skill_dir.mkdir()
+        skill_file = skill_dir / "SKILL.md"
+        skill_file.write_text("---\nname: my-skill\ndescription: old\n---\nBody\n")
+
+        loader = SkillLoader(str(tmp_path))
+        assert loader.discover_skills()[0].description == "old"
+
+        skill_file.write_text("---\nname: my-skill\ndescription: newer\n---\nBody\n")
+        assert loader.discover_skills()[0].description == "newer"
+
+        skill_file.unlink()
+        assert loader.discover_skills() == []
+        assert loader.summary_cache == {}
+
+    def test_load_skill_after_rename(self, tmp_path):
+        """Test that load_skill rescans when the indexed name is stale."""
+        skill_dir = tmp_path / "a"
+        skill_dir.mkdir()
+        skill_file = skill_dir / "SKILL.md"
+        skill_file.write_text("---\nname: first\n---\nBody\n")
+
+        loader = SkillLoader(str(tmp_path))
+        assert loader.load_skill("first") is not None
+
+        skill_file.write_text("---\nname: second-name\n---\nBody\n")
+        assert loader.load_skill("first") is None
+        skill = loader.load_skill("second-name")
+        assert skill is not None
+        assert skill.skill_dir == str(skill_dir)
+
+    def testparse_frontmatter_ignores_non_fields(self, tmp_path):
+        """Test that only top-level 'key: value' lines become fields."""
+        content = """---
+name : spaced
+url: https://example.com/a:b
+  nested: skipped
+- item
+---
+Body
+"""
+        fm, body = parse_frontmatter(content)
+        assert fm == {"name": "spaced", "url": "https://example.com/a:b"}
+        assert body == "Body"
+
+    def testparse_frontmatter_digit_leading_key(self, tmp_path):
+        """Test that keys may start with a digit, like any word characters."""
+        fm, _ = parse_frontmatter("---\n2fa: required\nname: x\n---\nBody\n")
+        assert fm == {"2fa": "required", "name": "x"}
+
+    def test_discover_skills_reads_only_frontmatter(self, tmp_path):
+        """Test discovery with a large body and a frontmatter-like body line."""
+        skill_dir = tmp_path / "big"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: big\ndescription: d\n---\n"
+            + "x" * 10_000
+            + "\n---\nname: other\n---\n"
+        )
+
+        loader = SkillLoader(str(tmp_path))
+        summaries = loader.discover_skills()
+
+        assert [(s.name, s.description) for s in summaries] == [("big", "d")]
+        assert loader.load_skill("big").instructions.startswith("x" * 100)
+
+    def test_load_skill_cached_until_modified(self, tmp_path):
+        """Test that load_skill reuses the parsed skill until the file changes."""
+        skill_dir = tmp_path / "cached"
+        skill_dir.mkdir()
+        skill_file = skill_dir / "SKILL.md"
+        skill_file.write_text("---\nname: cached\n---\nv1\n")
+
+        loader = SkillLoader(str(tmp_path))
+        first = loader.load_skill("cached")
+        assert first is not None
+        assert loader.load_skill("cached") is first
+
+        skill_file.write_text("---\nname: cached\n---\nversion 2\n")
+        second = loader.load_skill("cached")
+        assert second is not None
+        assert second.instructions == "version 2"
@@ -58,3 +58,73 @@ class TestToolRegistry:
         result = await handler(value="hello")
         assert result["status"] == "success"
         assert result["value"] == "hello"
+
+    def test_tool_schemas_reused_until_register(self):
+        """Test that the tools payload is built once per set of registrations."""
+        registry = ToolRegistry()
+
+        async def first() -> dict:
+            return {}
+
+        async def second() -> dict:
+            return {}
+
+        registry.register(first, {})
+        payload = registry.tool_schemas()
+        assert registry.tool_schemas() is payload
+
+        registry.register(second, {})
+        assert [s["function"]["name"] for s in registry.tool_schemas()] == [
+            "first",
+            "second",
+        ]
+
+    def test_lazy_schemas_advertise_compact_summaries(self):
+        """Lazy registries strip parameter docs but keep property names."""
+        registry = ToolRegistry(lazy_schemas=True)
+
+        async def tool(description: str) -> dict:
+            """Short summary.
+
+            Long explanation that should not be advertised.
+            """
+            return {}
+
+        registry.register(
+            tool,
+            {
+                "type": "object",
+                "properties": {
+                    "description": {"type": "string", "description": "Docs."}
+                },
+            },
+        )
+
+        advertised = {
+            entry["function"]["name"]: entry["function"]
+            for entry in registry.clone().tool_schemas()
+        }
+        assert advertised["tool"]["description"] == "Short summary."
+        assert advertised["tool"]["parameters"]["properties"] == {
+            "description": {"type": "string"}
+        }
+        assert "describe_tool" in advertised
+
+    @pytest.mark.asyncio
+    async def test_describe_tool_returns_full_schema(self):
+        """describe_tool on a clone sees tools registered on that clone."""
+        registry = ToolRegistry(lazy_schemas=True).clone()
+
+        async def late_tool() -> dict:
+            """Registered after cloning."""
+            return {}
+
+        registry.register(late_tool, {})
+
+        handler = registry.get_handler("describe_tool")
+        assert handler is not None
+        found = await handler(name="late_tool")
+        missing = await handler(name="nope")
+        assert found.status == "success"
+        assert "Registered after cloning." in found.to_lm_content()
+        assert missing.status == "error"
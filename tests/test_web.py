@@ -0,0 +1,241 @@
+"""Tests for the web tool helpers."""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from agent.tools.web import (
+    PageFetcher,
+    RateLimiter,
+    SingleFlight,
+    TTLCache,
+    WebCacheStore,
+    normalize_query,
+    normalize_url,
+)
+
+# Declares its charset only in a <meta> tag; the HTTP header has none.
+_GBK_PAGE = '<html><head><meta charset="gbk"></head><p>你好</p></html>'.encode("gbk")
+
+
+@pytest_asyncio.fixture
+async def page_server():
+    """Serve a small HTML page and count accepted connections."""
+    connections: list[object] = []
+
+    async def page(request: web.Request) -> web.Response:
+        connections.append(request.transport)
+        return web.Response(text="<p>héllo</p>", content_type="text/html")
+
+    async def missing(request: web.Request) -> web.Response:
+        raise web.HTTPNotFound()
+
+    async def legacy(request: web.Request) -> web.Response:
+        return web.Response(body=_GBK_PAGE, content_type="text/html")
+
+    async def chunked(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for _ in range(8):
+            await response.write(b"x" * 1024)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/page", page)
+    app.router.add_get("/missing", missing)
+    app.router.add_get("/chunked", chunked)
+    app.router.add_get("/legacy", legacy)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    yield f"http://127.0.0.1:{port}", connections
+    await runner.cleanup()
+
+
+class TestPageFetcher:
+    """Tests for PageFetcher."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_reuses_connection(self, page_server):
+        """Test that consecutive fetches share one keep-alive connection."""
+        base_url, connections = page_server
+        fetcher = PageFetcher(timeout=5)
+        try:
+            assert await fetcher.fetch(f"{base_url}/page") == "<p>héllo</p>".encode()
+            assert await fetcher.fetch(f"{base_url}/page") == "<p>héllo</p>".encode()
+        finally:
+            await fetcher.close()
+
+        assert len(connections) == 2
+        assert len({id(t) for t in connections}) == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_raises_on_http_error(self, page_server):
+        """Test that HTTP error statuses surface as exceptions."""
+        base_url, _ = page_server
+        fetcher = PageFetcher(timeout=5)
+        try:
+            with pytest.raises(Exception, match="404"):
+                await fetcher.fetch(f"{base_url}/missing")
+        finally:
+            await fetcher.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_returns_undecoded_body(self, page_server):
+        """Test that a meta-declared non-UTF-8 page is passed on byte for byte."""
+        base_url, _ = page_server
+        fetcher = PageFetcher(timeout=5)
+        try:
+            assert await fetcher.fetch(f"{base_url}/legacy") == _GBK_PAGE
+        finally:
+            await fetcher.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_caps_body_without_content_length(
+        self, page_server, monkeypatch
+    ):
+        """Test that a chunked body over the cap is aborted while downloading."""
+        base_url, _ = page_server
+        monkeypatch.setattr("agent.tools.web._MAX_PAGE_BYTES", 4096)
+        fetcher = PageFetcher(timeout=5)
+        try:
+            with pytest.raises(ValueError, match="exceeds 4096 bytes"):
+                await fetcher.fetch(f"{base_url}/chunked")
+        finally:
+            await fetcher.close()
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_run(self):
+        """Test that identical concurrent calls run once and later calls rerun."""
+        flight: SingleFlight[int] = SingleFlight()
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        assert await asyncio.gather(*(flight.run("k", call) for _ in range(3))) == [
+            1,
+            1,
+            1,
+        ]
+        assert await flight.run("k", call) == 2
+        assert flight.calls == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test that the shared call survives one caller being cancelled."""
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def call() -> str:
+            await asyncio.sleep(0.01)
+            return "done"
+
+        first = asyncio.create_task(flight.run("k", call))
+        second = asyncio.create_task(flight.run("k", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "done"
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_paces_after_burst(self):
+        """Test that calls beyond the burst wait for refilled tokens."""
+        limiter = RateLimiter(rate=50, burst=2)
+        start = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire()
+        assert time.monotonic() - start >= 0.035
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_is_unlimited(self):
+        """Test that a zero rate never waits."""
+        limiter = RateLimiter(rate=0)
+        start = time.monotonic()
+        for _ in range(100):
+            await limiter.acquire()
+        assert time.monotonic() - start < 0.05
+
+
+class TestTTLCache:
+    """Tests for the web caches and the key normalizers."""
+
+    def test_expiry_and_lru_eviction(self, monkeypatch):
+        """Test that entries expire after the TTL and the LRU entry is evicted."""
+        now = [100.0]
+        monkeypatch.setattr("agent.tools.web.time.monotonic", lambda: now[0])
+        cache: TTLCache[str] = TTLCache(ttl_seconds=10, max_entries=2)
+
+        cache.put("a", "1")
+        cache.put("b", "2")
+        assert cache.get("a") == "1"
+        cache.put("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+
+        now[0] += 10
+        assert cache.get("a") is None
+        assert list(cache.entries) == ["c"]
+
+    def test_per_entry_ttl(self, monkeypatch):
+        """Test that put() can give an entry a shorter TTL."""
+        now = [100.0]
+        monkeypatch.setattr("agent.tools.web.time.monotonic", lambda: now[0])
+        cache: TTLCache[str] = TTLCache(ttl_seconds=10, max_entries=8)
+
+        cache.put("ok", "1")
+        cache.put("failed", "2", ttl_seconds=2)
+        now[0] += 2
+        assert cache.get("failed") is None
+        assert cache.get("ok") == "1"
+
+    def test_disabled(self):
+        """Test that a zero TTL stores nothing."""
+        cache: TTLCache[str] = TTLCache(ttl_seconds=0, max_entries=8)
+        cache.put("a", "1")
+        assert cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_store_survives_reopen_and_expires(self, tmp_path, monkeypatch):
+        """Test that stored values outlive the connection until they expire."""
+        path = str(tmp_path / "web.sqlite")
+        store = WebCacheStore(path)
+        await store.put("search", "q", [{"title": "t"}], ttl_seconds=10)
+        store.close()
+
+        now = [time.time()]
+        monkeypatch.setattr("agent.tools.web.time.time", lambda: now[0])
+        reopened = WebCacheStore(path)
+        hit = await reopened.get("search", "q")
+        assert hit is not None
+        assert hit[0] == [{"title": "t"}]
+        assert await reopened.get("fetch", "q") is None
+        now[0] += 10
+        assert await reopened.get("search", "q") is None
+        reopened.close()
+
+    def test_normalizers(self):
+        """Test that equivalent queries and URLs share a cache key."""
+        assert normalize_query("  Python   Asyncio ") == normalize_query(
+            "python asyncio"
+        )
+        assert (
+            normalize_url("HTTPS://Example.COM/Path?q=1#section")
+            == "https://example.com/Path?q=1"
+        )
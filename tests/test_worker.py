@@ -0,0 +1,189 @@
+"""Tests for ConversationWorker event processing."""
+
+import asyncio
+import contextlib
+from types import SimpleNamespace
+
+import pytest
+
+from agent.core.events import HeartbeatEvent, TextInputEvent
+from agent.engine.worker import ConversationWorker, _estimate_tokens
+from tests.helpers import RecordingChannel
+
+
+@pytest.fixture
+def worker(mock_settings):
+    return ConversationWorker(mock_settings, None, None, None)  # pyright: ignore[reportArgumentType]
+
+
+async def _run_until_idle(worker: ConversationWorker) -> None:
+    task = asyncio.create_task(worker.run())
+    await worker.queue.join()
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+class TestConversationWorker:
+    """Tests for ConversationWorker batching."""
+
+    @pytest.mark.asyncio
+    async def test_queued_heartbeats_coalesce_to_last(self, worker):
+        """Only the most recent of several queued heartbeats is processed."""
+        sender = RecordingChannel()
+        handled: list[object] = []
+
+        async def record(event: object) -> None:
+            handled.append(event)
+
+        worker.event_handlers = {HeartbeatEvent: record, TextInputEvent: record}
+        first = HeartbeatEvent(chat_id="c1", interval_seconds=10, sender=sender)
+        text = TextInputEvent(
+            chat_id="c1", message_id="m1", message="hi", sender=sender
+        )
+        last = HeartbeatEvent(chat_id="c1", interval_seconds=20, sender=sender)
+        for event in (first, text, last):
+            worker.queue.put_nowait(event)
+
+        await _run_until_idle(worker)
+
+        assert handled == [text, last]
+
+    @pytest.mark.asyncio
+    async def test_compresses_before_message_that_would_overflow(self, mock_settings):
+        """The incoming message's estimated size counts toward the threshold."""
+        compressed: list[int] = []
+
+        async def compress(messages: list, keep_last: int) -> None:
+            compressed.append(len(messages))
+
+        settings = mock_settings.model_copy(
+            update={"context_auto_compression_enabled": True, "context_max_tokens": 100}
+        )
+        agent = SimpleNamespace(compress=compress)
+        worker = ConversationWorker(settings, agent, None, None)  # pyright: ignore[reportArgumentType]
+        worker.conversation.messages = [{"role": "user", "content": "earlier"}]
+        worker.conversation.total_tokens = 90
+        sender = RecordingChannel()
+
+        await worker._maybe_compress(sender, incoming_tokens=5)
+        assert compressed == []
+
+        await worker._maybe_compress(
+            sender, _estimate_tokens({"role": "user", "content": "x" * 40})
+        )
+        assert compressed == [1]
+        assert worker.conversation.total_tokens == 0
+
+    def test_message_id_window_is_bounded(self, worker, monkeypatch):
+        """The oldest ids are forgotten once the dedup window is full."""
+        monkeypatch.setattr("agent.engine.worker.MAX_TRACKED_MESSAGE_IDS", 2)
+
+        assert not worker.is_duplicate("m1")
+        assert not worker.is_duplicate("m2")
+        assert worker.is_duplicate("m1")
+        assert not worker.is_duplicate("m3")
+
+        assert list(worker.message_ids) == ["m1", "m3"]
+        assert not worker.is_duplicate("m2")
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_fires_after_idle_interval(self, worker):
+        """The loop timer armed after activity enqueues the heartbeat when idle.
+
+        Processing the text input arms a call_at timer for the heartbeat
+        interval; when it fires with no newer activity, the heartbeat event is
+        put back on the worker's queue.
+        """
+        sender = RecordingChannel()
+        heartbeats = asyncio.Queue()
+
+        async def record(event: object) -> None:
+            pass
+
+        worker.event_handlers = {
+            TextInputEvent: record,
+            HeartbeatEvent: heartbeats.put,
+        }
+        worker.heartbeat_event = HeartbeatEvent(
+            chat_id="c1",
+            interval_seconds=0.01,  # pyright: ignore[reportArgumentType]
+            sender=sender,
+        )
+        worker.queue.put_nowait(
+            TextInputEvent(chat_id="c1", message_id="m1", message="hi", sender=sender)
+        )
+
+        task = asyncio.create_task(worker.run())
+        fired = await asyncio.wait_for(heartbeats.get(), timeout=1)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        assert fired is worker.heartbeat_event
+
+    def test_consecutive_text_inputs_merge_into_one_turn(self):
+        """Back-to-back texts become one turn; other events split the run."""
+        sender = RecordingChannel()
+        texts = [
+            TextInputEvent(
+                chat_id="c1", message_id=f"m{i}", message=f"part {i}", sender=sender
+            )
+            for i in range(3)
+        ]
+        heartbeat = HeartbeatEvent(chat_id="c1", interval_seconds=10, sender=sender)
+
+        coalesced = ConversationWorker._coalesce(
+            [texts[0], texts[1], heartbeat, texts[2]]
+        )
+
+        assert len(coalesced) == 3
+        merged = coalesced[0]
+        assert isinstance(merged, TextInputEvent)
+        assert merged.message == "part 0\n\npart 1"
+        assert merged.message_id == "m1"
+        assert coalesced[1:] == [heartbeat, texts[2]]
+
+    def test_background_orchestrator_reused_per_sender(self, mock_settings):
+        """A new background orchestrator is only built when the channel changes."""
+        built: list[object] = []
+
+        def make_background(sender: object) -> SimpleNamespace:
+            built.append(sender)
+            return SimpleNamespace(sender=sender)
+
+        factory = SimpleNamespace(make_background=make_background)
+        worker = ConversationWorker(mock_settings, None, None, factory)  # pyright: ignore[reportArgumentType]
+        first, second = RecordingChannel(), RecordingChannel()
+
+        a = worker._background_orchestrator(first)
+        assert worker._background_orchestrator(first) is a
+        assert worker._background_orchestrator(second) is not a
+        assert built == [first, second]
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_timer_rearms_after_activity(self, worker):
+        """Activity during the countdown pushes the heartbeat out, not cancels it."""
+        sender = RecordingChannel()
+        worker.heartbeat_event = HeartbeatEvent(
+            chat_id="c1",
+            interval_seconds=0.05,  # pyright: ignore[reportArgumentType]
+            sender=sender,
+        )
+        loop = asyncio.get_running_loop()
+
+        worker._arm_heartbeat()
+        first_timer = worker.heartbeat_timer
+        await asyncio.sleep(0.03)
+        worker._arm_heartbeat()
+
+        assert worker.heartbeat_timer is first_timer
+        await asyncio.sleep(0.03)
+        assert worker.queue.empty()
+        assert worker.heartbeat_timer is not None
+        assert worker.heartbeat_timer.when() == pytest.approx(
+            worker.last_activity + 0.05
+        )
+
+        await asyncio.wait_for(worker.queue.get(), timeout=1)
+        assert loop.time() >= worker.last_activity + 0.05